@@ -2,7 +2,9 @@
 Configuration and style templates for FFmpeg text overlay service
 """
 import os
-from typing import Dict, Any
+import copy
+import time
+from typing import Dict, Any, Tuple
 from dataclasses import dataclass
 
 
@@ -12,7 +14,13 @@ class Config:
     MAX_FILE_SIZE = int(os.getenv("MAX_FILE_SIZE", 100 * 1024 * 1024))  # 100MB default
     UPLOAD_TIMEOUT = int(os.getenv("UPLOAD_TIMEOUT", 30))  # 30 seconds
     DOWNLOAD_TIMEOUT = int(os.getenv("DOWNLOAD_TIMEOUT", 300))  # 5 minutes for downloads
+    DOWNLOAD_PREVALIDATE_TIMEOUT = int(os.getenv("DOWNLOAD_PREVALIDATE_TIMEOUT", 5))  # HEAD check before merge downloads
+    DOWNLOAD_MAX_CONNECTIONS = int(os.getenv("DOWNLOAD_MAX_CONNECTIONS", 32))  # Pooled connections across all hosts
+    DOWNLOAD_MAX_CONNECTIONS_PER_HOST = int(os.getenv("DOWNLOAD_MAX_CONNECTIONS_PER_HOST", 8))
     TEMP_DIR = "/app/temp" if os.path.exists("/app") else "./temp"
+    TEMPLATE_CACHE_TTL = int(os.getenv("TEMPLATE_CACHE_TTL", 30))  # seconds, 0 disables
+    # drawtext text files are tiny and short-lived; keep them on tmpfs when available
+    TEXT_TEMP_DIR = os.getenv("TEXT_TEMP_DIR") or ("/dev/shm" if os.path.isdir("/dev/shm") else None)
     FONT_DIR = "/usr/share/fonts/truetype/custom" if os.path.exists("/usr/share/fonts/truetype/custom") else "./fonts"
 
     # Font paths
@@ -38,10 +46,57 @@ class Config:
     R2_SECRET_ACCESS_KEY = os.getenv("R2_SECRET_ACCESS_KEY", "")
     R2_BUCKET_NAME = os.getenv("R2_BUCKET_NAME", "")
     R2_CUSTOM_DOMAIN = os.getenv("R2_CUSTOM_DOMAIN", "")  # Optional custom domain
+    # Uploads above this size are split into parts of this size, sent in parallel
+    R2_MULTIPART_CHUNK_SIZE = int(os.getenv("R2_MULTIPART_CHUNK_SIZE", 8 * 1024 * 1024))
+    R2_UPLOAD_CONCURRENCY = int(os.getenv("R2_UPLOAD_CONCURRENCY", 8))  # Parallel parts per upload
+    R2_IO_CHUNK_SIZE = int(os.getenv("R2_IO_CHUNK_SIZE", 2 * 1024 * 1024))  # Read size per file read (boto3 default 256KB)
+
+    # ffprobe limits - width/codec/duration live in the container header for the
+    # formats we handle, so the default 5MB/5s stream analysis is unnecessary
+    FFPROBE_PROBESIZE = int(os.getenv("FFPROBE_PROBESIZE", 500000))  # bytes
+    FFPROBE_ANALYZEDURATION = int(os.getenv("FFPROBE_ANALYZEDURATION", 500000))  # microseconds
+
+    # libx264 encoding - veryfast costs a fraction of the CPU of slow/medium with
+    # negligible size difference for overlay/merge outputs
+    LIBX264_PRESET = os.getenv("LIBX264_PRESET", "veryfast")
+    LIBX264_CRF = os.getenv("LIBX264_CRF", "18")  # 18 = high quality, lower = better
+
+    # Encoder/filter threads per FFmpeg process (0 = let FFmpeg use all cores);
+    # lower it on memory-constrained hosts
+    FFMPEG_THREADS = int(os.getenv("FFMPEG_THREADS", 0))
+
+    # Max concurrent FFmpeg jobs for batch operations; half the cores because each
+    # FFmpeg process already threads internally
+    FFMPEG_WORKER_POOL = int(os.getenv("FFMPEG_WORKER_POOL", max(1, (os.cpu_count() or 2) // 2)))
+
+    # Kill an FFmpeg job that reports no progress for this many seconds (hang detection);
+    # 0 or less disables stall detection (jobs are then only bounded by their timeout)
+    FFMPEG_STALL_TIMEOUT = int(os.getenv("FFMPEG_STALL_TIMEOUT", 60))
+
+    # Video encoder: "libx264" (default), "auto" to use a hardware H.264 encoder
+    # (NVENC/QSV/AMF/VideoToolbox) when one is usable, or an explicit encoder name
+    VIDEO_ENCODER = os.getenv("VIDEO_ENCODER", "libx264")
+
+    # Decode on the GPU for text overlays when the encoder is h264_nvenc
+    # (frames are downloaded for drawtext and uploaded again for encoding)
+    FFMPEG_HWACCEL = os.getenv("FFMPEG_HWACCEL", "false").lower() == "true"
 
     # Merge/Concat Configuration
     MAX_MERGE_CLIPS = int(os.getenv("MAX_MERGE_CLIPS", 10))  # Maximum clips per merge request
     MERGE_TIMEOUT = int(os.getenv("MERGE_TIMEOUT", 600))  # 10 minutes processing timeout
+    # Overlay and concatenate all clips in one FFmpeg pass; "false" falls back to
+    # per-clip overlay encodes followed by a separate merge
+    MERGE_SINGLE_PASS = os.getenv("MERGE_SINGLE_PASS", "true").lower() == "true"
+    # With MERGE_SINGLE_PASS off: stream per-clip overlays into the merge through named
+    # pipes instead of temp files (the merge then re-encodes rather than stream-copies)
+    MERGE_STREAM_OVERLAYS = os.getenv("MERGE_STREAM_OVERLAYS", "false").lower() == "true"
+    # Kernel buffer for streaming-merge named pipes (above /proc/sys/fs/pipe-max-size needs CAP_SYS_RESOURCE)
+    MERGE_PIPE_BUFFER_SIZE = int(os.getenv("MERGE_PIPE_BUFFER_SIZE", 1024 * 1024))
+
+    # Background removal: models loaded in the background at startup (comma-separated,
+    # opt-in) so the first /rembg request doesn't pay for the model load. Models missing
+    # from the image are downloaded first, and every preloaded model stays in memory
+    REMBG_PRELOAD_MODELS = [m.strip() for m in os.getenv("REMBG_PRELOAD_MODELS", "").split(",") if m.strip()]
 
 
 @dataclass
@@ -90,13 +145,29 @@ class TextStyle:
 DATABASE_URL = os.getenv("DATABASE_URL", "")
 
 
+# Templates loaded from the database: name -> (expires_at, style)
+_TEMPLATE_CACHE: Dict[str, Tuple[float, TextStyle]] = {}
+
+
+def clear_template_cache() -> None:
+    """Forget cached templates (call after any template write)"""
+    _TEMPLATE_CACHE.clear()
+
+
 def get_template(template_name: str) -> TextStyle:
     """
     Get a style template by name from database
     Falls back to default template if not found
+
+    Loaded templates are cached for TEMPLATE_CACHE_TTL seconds; every caller
+    gets its own copy.
     """
     from services.template_service import TemplateService
 
+    cached = _TEMPLATE_CACHE.get(template_name)
+    if cached and cached[0] > time.monotonic():
+        return copy.copy(cached[1])
+
     try:
         template_service = TemplateService()
         template_data = template_service.get_template(template_name)
@@ -107,7 +178,7 @@ def get_template(template_name: str) -> TextStyle:
 
         if template_data:
             # Convert DB record to TextStyle
-            return TextStyle(
+            style = TextStyle(
                 font_path=template_data['font_path'],
                 font_size=template_data['font_size'],
                 text_color=template_data['text_color'],
@@ -124,6 +195,10 @@ def get_template(template_name: str) -> TextStyle:
                 max_text_width_percent=template_data.get('max_text_width_percent', 80),
                 line_spacing=template_data.get('line_spacing', -8)
             )
+            if Config.TEMPLATE_CACHE_TTL > 0:
+                _TEMPLATE_CACHE[template_name] = (time.monotonic() + Config.TEMPLATE_CACHE_TTL, style)
+                return copy.copy(style)
+            return style
     except Exception as e:
         print(f"Error loading template from database: {e}")
 
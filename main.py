@@ -48,6 +48,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Startup work that runs in the background (strong references so tasks aren't garbage collected mid-run)
+_BACKGROUND_TASKS = set()
+
 # Initialize FastAPI app
 app = FastAPI(
     title="FFmpeg Text Overlay API",
@@ -163,6 +166,23 @@ async def startup_event():
         logger.info("Updating default template styling...")
         template_service.update_default_template_styling()
 
+        # Probe hardware encoders now so the first encode doesn't pay for detection
+        if Config.VIDEO_ENCODER == "auto":
+            logger.info("Detecting hardware video encoder...")
+            await asyncio.to_thread(ffmpeg_service._detect_hw_encoder)
+
+        # Remove overlayed clips left behind by merges interrupted by a restart
+        await asyncio.to_thread(MergeService.sweep_orphaned_files)
+        ffmpeg_service.check_temp_dir()
+
+        # Load background removal models in the background so the first /rembg request
+        # doesn't wait on it; startup (and the healthcheck) doesn't wait on the download
+        if Config.REMBG_PRELOAD_MODELS:
+            logger.info(f"Preloading rembg models in the background: {', '.join(Config.REMBG_PRELOAD_MODELS)}")
+            task = asyncio.create_task(asyncio.to_thread(rembg_service.preload, Config.REMBG_PRELOAD_MODELS))
+            _BACKGROUND_TASKS.add(task)
+            task.add_done_callback(_BACKGROUND_TASKS.discard)
+
         # Bootstrap default user
         logger.info("Bootstrapping default user...")
         user, api_key = auth_service.bootstrap_default_user()
@@ -184,6 +204,13 @@ async def startup_event():
         logger.warning("Application starting with limited functionality")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled HTTP connections and finish pending temp file cleanups"""
+    await DownloadService.close()
+    await MergeService.wait_for_cleanups()
+
+
 @app.get("/", response_model=dict)
 async def root():
     """Root endpoint with API information"""
@@ -895,7 +922,7 @@ async def overlay_from_url(request: URLOverlayRequest, http_request: Request):
         output_path = os.path.join(Config.TEMP_DIR, output_filename)
 
         # Process with FFmpeg
-        result = ffmpeg_service.add_text_overlay(
+        result = await ffmpeg_service.add_text_overlay_async(
             input_path=input_path,
             output_path=output_path,
             text=request.text,
@@ -1074,7 +1101,7 @@ async def overlay_from_upload(
         output_path = os.path.join(Config.TEMP_DIR, output_filename)
 
         # Process with FFmpeg
-        result = ffmpeg_service.add_text_overlay(
+        result = await ffmpeg_service.add_text_overlay_async(
             input_path=input_path,
             output_path=output_path,
             text=text,
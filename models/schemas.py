@@ -2,7 +2,7 @@
 Pydantic models for request/response validation
 """
 from pydantic import BaseModel, Field, HttpUrl, field_validator
-from typing import Optional, Literal, List, Dict
+from typing import Any, Optional, Literal, List, Dict, Tuple
 import re
 
 DEFAULT_OUTFIT_DURATION = 6.0
@@ -90,6 +90,19 @@ def sanitize_unicode(text: str) -> str:
     return cleaned.strip()
 
 
+# Single-pass translation table applied to user-facing overlay text:
+# smart/curly quotes become straight quotes (TikTokSans font compatibility) and
+# the only truly dangerous shell characters are dropped (apostrophes are preserved!)
+TEXT_TRANSLATION = str.maketrans({
+    "\u2019": "'",  # U+2019 right single quote → apostrophe
+    "\u2018": "'",  # U+2018 left single quote → apostrophe
+    "\u201C": '"',  # U+201C left double quote → straight
+    "\u201D": '"',  # U+201D right double quote → straight
+    "`": None,
+    "$": None,
+})
+
+
 class TextOverrideOptions(BaseModel):
     """Optional overrides for text styling"""
     font_family: Optional[Literal["regular", "bold"]] = None  # Deprecated, use font_weight instead
@@ -155,21 +168,14 @@ class URLOverlayRequest(BaseModel):
     output_format: Optional[Literal["same", "mp4", "jpg", "png"]] = "same"
     response_format: Optional[Literal["binary", "url"]] = "binary"
 
-    @field_validator("text")
+    @field_validator("text", mode="before")
     @classmethod
-    def validate_text(cls, v: str) -> str:
+    def validate_text(cls, v: Any) -> Any:
         """Sanitize text - normalize quotes for font compatibility, remove dangerous chars"""
+        if not isinstance(v, str):
+            return v
         v = sanitize_unicode(v)
-        # Convert smart/curly quotes to straight quotes (TikTokSans font compatibility)
-        v = v.replace("\u2019", "'")  # U+2019 right single quote → apostrophe
-        v = v.replace("\u2018", "'")  # U+2018 left single quote → apostrophe
-        v = v.replace("\u201C", '"')  # U+201C left double quote → straight
-        v = v.replace("\u201D", '"')  # U+201D right double quote → straight
-        # Only remove truly dangerous shell characters (preserve apostrophes!)
-        dangerous_chars = ['`', '$']
-        for char in dangerous_chars:
-            v = v.replace(char, '')
-        return v.strip()
+        return v.translate(TEXT_TRANSLATION).strip()
 
 
 class UploadOverlayRequest(BaseModel):
@@ -180,21 +186,14 @@ class UploadOverlayRequest(BaseModel):
     output_format: Optional[Literal["same", "mp4", "jpg", "png"]] = "same"
     response_format: Optional[Literal["binary", "url"]] = "binary"
 
-    @field_validator("text")
+    @field_validator("text", mode="before")
     @classmethod
-    def validate_text(cls, v: str) -> str:
+    def validate_text(cls, v: Any) -> Any:
         """Sanitize text - normalize quotes for font compatibility, remove dangerous chars"""
+        if not isinstance(v, str):
+            return v
         v = sanitize_unicode(v)
-        # Convert smart/curly quotes to straight quotes (TikTokSans font compatibility)
-        v = v.replace("\u2019", "'")  # U+2019 right single quote → apostrophe
-        v = v.replace("\u2018", "'")  # U+2018 left single quote → apostrophe
-        v = v.replace("\u201C", '"')  # U+201C left double quote → straight
-        v = v.replace("\u201D", '"')  # U+201D right double quote → straight
-        # Only remove truly dangerous shell characters (preserve apostrophes!)
-        dangerous_chars = ['`', '$']
-        for char in dangerous_chars:
-            v = v.replace(char, '')
-        return v.strip()
+        return v.translate(TEXT_TRANSLATION).strip()
 
 
 class OverlayResponse(BaseModel):
@@ -304,22 +303,15 @@ class ClipConfig(BaseModel):
     template: str = "default"
     overrides: Optional[TextOverrideOptions] = None
 
-    @field_validator("text")
+    @field_validator("text", mode="before")
     @classmethod
-    def validate_text(cls, v: str) -> str:
+    def validate_text(cls, v: Any) -> Any:
         """Sanitize text - remove invisible Unicode chars, normalize quotes, remove dangerous chars"""
+        if not isinstance(v, str):
+            return v
         # FIRST: Remove invisible Unicode chars that cause FFmpeg BOX symbols
         v = sanitize_unicode(v)
-        # Convert smart/curly quotes to straight quotes (TikTokSans font compatibility)
-        v = v.replace("\u2019", "'")  # U+2019 right single quote → apostrophe
-        v = v.replace("\u2018", "'")  # U+2018 left single quote → apostrophe
-        v = v.replace("\u201C", '"')  # U+201C left double quote → straight
-        v = v.replace("\u201D", '"')  # U+201D right double quote → straight
-        # Only remove truly dangerous shell characters (preserve apostrophes!)
-        dangerous_chars = ['`', '$']
-        for char in dangerous_chars:
-            v = v.replace(char, '')
-        return v.strip()
+        return v.translate(TEXT_TRANSLATION).strip()
 
 
 class MergeRequest(BaseModel):
@@ -363,21 +355,14 @@ class OutfitRequest(BaseModel):
     fade_in: Optional[float] = Field(DEFAULT_OUTFIT_FADE_IN, ge=MIN_OUTFIT_FADE_IN, le=MAX_OUTFIT_FADE_IN)
     response_format: Optional[Literal["binary", "url"]] = "url"
 
-    @field_validator("main_title", "subtitle")
+    @field_validator("main_title", "subtitle", mode="before")
     @classmethod
-    def validate_text(cls, v: str) -> str:
+    def validate_text(cls, v: Any) -> Any:
         """Sanitize text - remove invisible Unicode chars that cause FFmpeg BOX symbols"""
+        if not isinstance(v, str):
+            return v
         v = sanitize_unicode(v)
-        # Convert smart/curly quotes to straight quotes (TikTokSans font compatibility)
-        v = v.replace("\u2019", "'")  # U+2019 right single quote → apostrophe
-        v = v.replace("\u2018", "'")  # U+2018 left single quote → apostrophe
-        v = v.replace("\u201C", '"')  # U+201C left double quote → straight
-        v = v.replace("\u201D", '"')  # U+201D right double quote → straight
-        # Only remove truly dangerous shell characters (preserve apostrophes!)
-        dangerous_chars = ['`', '$']
-        for char in dangerous_chars:
-            v = v.replace(char, '')
-        return v.strip()
+        return v.translate(TEXT_TRANSLATION).strip()
 
     @field_validator("image_urls")
     @classmethod
@@ -412,21 +397,14 @@ class POVTemplateRequest(BaseModel):
     fade_in: Optional[float] = Field(DEFAULT_POV_FADE_IN, ge=MIN_POV_FADE_IN, le=MAX_POV_FADE_IN)
     response_format: Optional[Literal["binary", "url"]] = "url"
 
-    @field_validator("main_title", "subtitle")
+    @field_validator("main_title", "subtitle", mode="before")
     @classmethod
-    def validate_text(cls, v: str) -> str:
+    def validate_text(cls, v: Any) -> Any:
         """Sanitize text - remove invisible Unicode chars that cause FFmpeg BOX symbols"""
+        if not isinstance(v, str):
+            return v
         v = sanitize_unicode(v)
-        # Convert smart/curly quotes to straight quotes (TikTokSans font compatibility)
-        v = v.replace("\u2019", "'")  # U+2019 right single quote → apostrophe
-        v = v.replace("\u2018", "'")  # U+2018 left single quote → apostrophe
-        v = v.replace("\u201C", '"')  # U+201C left double quote → straight
-        v = v.replace("\u201D", '"')  # U+201D right double quote → straight
-        # Only remove truly dangerous shell characters (preserve apostrophes!)
-        dangerous_chars = ['`', '$']
-        for char in dangerous_chars:
-            v = v.replace(char, '')
-        return v.strip()
+        return v.translate(TEXT_TRANSLATION).strip()
 
     @field_validator("images")
     @classmethod
@@ -470,19 +448,14 @@ class OutfitSingleRequest(BaseModel):
     )
     response_format: Optional[Literal["binary", "url"]] = "url"
 
-    @field_validator("main_title", "subtitle")
+    @field_validator("main_title", "subtitle", mode="before")
     @classmethod
-    def validate_text(cls, v: str) -> str:
+    def validate_text(cls, v: Any) -> Any:
         """Sanitize text - remove invisible Unicode chars that cause FFmpeg BOX symbols"""
+        if not isinstance(v, str):
+            return v
         v = sanitize_unicode(v)
-        v = v.replace("\u2019", "'")
-        v = v.replace("\u2018", "'")
-        v = v.replace("\u201C", '"')
-        v = v.replace("\u201D", '"')
-        dangerous_chars = ['`', '$']
-        for char in dangerous_chars:
-            v = v.replace(char, '')
-        return v.strip()
+        return v.translate(TEXT_TRANSLATION).strip()
 
     @field_validator("images")
     @classmethod
@@ -521,7 +494,7 @@ class RembgRequest(BaseModel):
     erode_size: Optional[int] = Field(8, ge=0, le=50)
     # Post-processing for smoother mask edges
     post_process_mask: Optional[bool] = True
-    bgcolor: Optional[List[int]] = Field(None, min_length=4, max_length=4)
+    bgcolor: Optional[Tuple[int, int, int, int]] = None  # RGBA
 
 
 class RembgResponse(BaseModel):
@@ -5,17 +5,50 @@ import aiohttp
 import asyncio
 import os
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
 from config import Config
 import uuid
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Browser-like headers to bypass Cloudflare bot protection (Referer is added per request)
+DOWNLOAD_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'video/mp4,video/*,*/*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+}
+
+# Process-wide session so downloads reuse pooled (keep-alive) connections and cached DNS
+_SESSION: Optional[aiohttp.ClientSession] = None
+
 
 class DownloadService:
     """Handles downloading files from URLs"""
 
+    @staticmethod
+    def _get_session() -> aiohttp.ClientSession:
+        """Return the shared client session, creating it on first use"""
+        global _SESSION
+        if _SESSION is None or _SESSION.closed:
+            connector = aiohttp.TCPConnector(
+                limit=Config.DOWNLOAD_MAX_CONNECTIONS,
+                limit_per_host=Config.DOWNLOAD_MAX_CONNECTIONS_PER_HOST,
+                ttl_dns_cache=300
+            )
+            _SESSION = aiohttp.ClientSession(connector=connector, headers=DOWNLOAD_HEADERS)
+        return _SESSION
+
+    @staticmethod
+    async def close() -> None:
+        """Close the shared client session (call on application shutdown)"""
+        global _SESSION
+        if _SESSION is not None and not _SESSION.closed:
+            await _SESSION.close()
+        _SESSION = None
+
     @staticmethod
     async def download_from_url(url: str) -> Tuple[str, str]:
         """
@@ -34,61 +67,50 @@ class DownloadService:
             # Use configurable timeout for downloads
             timeout = aiohttp.ClientTimeout(total=Config.DOWNLOAD_TIMEOUT)  # Configurable download timeout
 
-            # Add browser-like headers to bypass Cloudflare bot protection
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'video/mp4,video/*,*/*',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Referer': url,
-            }
-
-            async with aiohttp.ClientSession(timeout=timeout, headers=headers) as session:
-                async with session.get(url, allow_redirects=True) as response:
-                    if response.status != 200:
-                        raise Exception(f"Failed to download file: HTTP {response.status}")
-
-                    # Get content type
-                    content_type = response.headers.get('Content-Type', 'application/octet-stream')
-
-                    # Validate content type
-                    if not DownloadService._is_valid_content_type(content_type):
-                        raise Exception(f"Invalid content type: {content_type}")
-
-                    # Get file size from headers
-                    content_length = response.headers.get('Content-Length')
-                    if content_length and int(content_length) > Config.MAX_FILE_SIZE:
-                        raise Exception(f"File too large: {content_length} bytes (max: {Config.MAX_FILE_SIZE})")
-
-                    # Generate unique filename
-                    file_extension = DownloadService._get_extension_from_content_type(content_type)
-                    unique_filename = f"{uuid.uuid4()}{file_extension}"
-                    file_path = os.path.join(Config.TEMP_DIR, unique_filename)
-
-                    # Ensure temp directory exists
-                    os.makedirs(Config.TEMP_DIR, exist_ok=True)
-
-                    # Download file in chunks
-                    total_size = 0
-                    chunk_size = 1024 * 1024  # 1MB chunks
-
-                    with open(file_path, 'wb') as f:
-                        async for chunk in response.content.iter_chunked(chunk_size):
-                            total_size += len(chunk)
-
-                            # Check size limit during download
-                            if total_size > Config.MAX_FILE_SIZE:
-                                # Clean up partial file
-                                f.close()
-                                if os.path.exists(file_path):
-                                    os.remove(file_path)
-                                raise Exception(f"File exceeds maximum size: {Config.MAX_FILE_SIZE} bytes")
-
-                            f.write(chunk)
-
-                    logger.info(f"Downloaded {total_size} bytes from {url} to {file_path}")
-                    return file_path, content_type
+            session = DownloadService._get_session()
+            async with session.get(url, allow_redirects=True, timeout=timeout, headers={'Referer': url}) as response:
+                if response.status != 200:
+                    raise Exception(f"Failed to download file: HTTP {response.status}")
+
+                # Get content type
+                content_type = response.headers.get('Content-Type', 'application/octet-stream')
+
+                # Validate content type
+                if not DownloadService._is_valid_content_type(content_type):
+                    raise Exception(f"Invalid content type: {content_type}")
+
+                # Get file size from headers
+                content_length = response.headers.get('Content-Length')
+                if content_length and int(content_length) > Config.MAX_FILE_SIZE:
+                    raise Exception(f"File too large: {content_length} bytes (max: {Config.MAX_FILE_SIZE})")
+
+                # Generate unique filename
+                file_extension = DownloadService._get_extension_from_content_type(content_type)
+                unique_filename = f"{uuid.uuid4()}{file_extension}"
+                file_path = os.path.join(Config.TEMP_DIR, unique_filename)
+
+                # Ensure temp directory exists
+                os.makedirs(Config.TEMP_DIR, exist_ok=True)
+
+                # Download file in chunks
+                total_size = 0
+                chunk_size = 1024 * 1024  # 1MB chunks
+
+                with open(file_path, 'wb') as f:
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        total_size += len(chunk)
+
+                        # Check size limit during download
+                        if total_size > Config.MAX_FILE_SIZE:
+                            # Clean up partial file
+                            f.close()
+                            os.unlink(file_path)
+                            raise Exception(f"File exceeds maximum size: {Config.MAX_FILE_SIZE} bytes")
+
+                        f.write(chunk)
+
+                logger.info(f"Downloaded {total_size} bytes from {url} to {file_path}")
+                return file_path, content_type
 
         except asyncio.TimeoutError:
             raise Exception(f"Download timed out after {Config.DOWNLOAD_TIMEOUT} seconds")
@@ -98,6 +120,42 @@ class DownloadService:
             logger.error(f"Download failed: {str(e)}")
             raise
 
+    @staticmethod
+    async def prevalidate_url(url: str) -> None:
+        """
+        Cheaply reject a URL before downloading it, using a HEAD request
+
+        Only definitive answers fail: a missing resource, a disallowed content type or
+        a declared size above MAX_FILE_SIZE. Servers that refuse or time out on HEAD
+        (e.g. GET-only presigned URLs) are left for the download itself to check.
+
+        Raises:
+            Exception: If the URL can't be downloaded successfully
+        """
+        if not url.lower().startswith(('http://', 'https://')):
+            raise Exception(f"Unsupported URL scheme: {url}")
+
+        try:
+            session = DownloadService._get_session()
+            timeout = aiohttp.ClientTimeout(total=Config.DOWNLOAD_PREVALIDATE_TIMEOUT)
+            async with session.head(url, allow_redirects=True, timeout=timeout, headers={'Referer': url}) as response:
+                status = response.status
+                content_type = response.headers.get('Content-Type')
+                content_length = response.headers.get('Content-Length')
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            logger.debug(f"HEAD prevalidation skipped for {url}: {e}")
+            return
+
+        if status in (404, 410):
+            raise Exception(f"Failed to download file: HTTP {status}")
+        if not 200 <= status < 300:
+            return
+
+        if content_type and not DownloadService._is_valid_content_type(content_type):
+            raise Exception(f"Invalid content type: {content_type}")
+        if content_length and content_length.isdigit() and int(content_length) > Config.MAX_FILE_SIZE:
+            raise Exception(f"File too large: {content_length} bytes (max: {Config.MAX_FILE_SIZE})")
+
     @staticmethod
     def _is_valid_content_type(content_type: str) -> bool:
         """Check if content type is allowed"""
@@ -125,9 +183,10 @@ class DownloadService:
     def cleanup_file(file_path: str) -> None:
         """Delete a temporary file"""
         try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                logger.info(f"Cleaned up temporary file: {file_path}")
+            os.unlink(file_path)
+            logger.info(f"Cleaned up temporary file: {file_path}")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.warning(f"Failed to cleanup file {file_path}: {str(e)}")
 
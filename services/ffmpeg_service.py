@@ -1,13 +1,23 @@
 """
 FFmpeg service for adding text overlays to images and videos
 """
+import asyncio
+import copy
 import subprocess
 import os
+import functools
+import json
 import tempfile
 import re
+import shutil
 import logging
-from pathlib import Path
-from typing import Dict, Any, Optional, Tuple, List
+import textwrap
+import threading
+import time
+from collections import deque
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple, List, Callable, BinaryIO, Mapping
 from config import Config, TextStyle, get_template
 from models.schemas import TextOverrideOptions, sanitize_unicode
 
@@ -17,29 +27,138 @@ logger = logging.getLogger(__name__)
 # Font sizes in templates are designed for 1080p and will be scaled proportionally
 BASE_RESOLUTION_WIDTH = 1080
 
+# Hardware H.264 encoders in order of preference (used when VIDEO_ENCODER=auto)
+HW_H264_ENCODERS = ('h264_nvenc', 'h264_qsv', 'h264_amf', 'h264_videotoolbox')
+
+# Only the ffprobe fields callers read (dimensions, duration, concat-copy signature)
+FFPROBE_ENTRIES = (
+    'format=duration'
+    ':stream=codec_type,codec_name,profile,width,height,pix_fmt,r_frame_rate,time_base'
+)
+
+# Linux ioctl for copy-on-write file clones (btrfs/XFS reflinks); not exposed by fcntl
+FICLONE = 0x40049409
+
+# Extensions treated as still images (processed without video encoding)
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png'})
+
+# Frame rate/pixel format every clip is normalized to before concatenation
+# (different frame rates between clips cause corrupted playback)
+CONCAT_NORMALIZE_FILTER = "fps=30,format=yuv420p"
+
+# Position presets (x, y drawtext expressions)
+POSITIONS: Mapping[str, Tuple[str, str]] = MappingProxyType({
+    "center": ("(w-text_w)/2", "(h-text_h)/2"),
+    "top-left": ("10", "10"),
+    "top-right": ("w-text_w-10", "10"),
+    "top-center": ("(w-text_w)/2", "10"),
+    "bottom-left": ("10", "h-text_h-10"),
+    "bottom-right": ("w-text_w-10", "h-text_h-10"),
+    "bottom-center": ("(w-text_w)/2", "h-text_h-10"),
+    "middle-left": ("10", "(h-text_h)/2"),
+    "middle-right": ("w-text_w-10", "(h-text_h)/2"),
+})
+
+# Named colors -> FFmpeg hex format
+COLOR_MAP = MappingProxyType({
+    'white': '0xFFFFFF',
+    'black': '0x000000',
+    'red': '0xFF0000',
+    'green': '0x00FF00',
+    'blue': '0x0000FF',
+    'yellow': '0xFFFF00',
+    'cyan': '0x00FFFF',
+    'magenta': '0xFF00FF',
+    'orange': '0xFFA500',
+    'purple': '0x800080',
+    'pink': '0xFFC0CB',
+    'gray': '0x808080',
+    'grey': '0x808080'
+})
+
+# Single-pass drawtext escaping. Each character is mapped independently, which is
+# equivalent to escaping backslashes before the escapes that introduce new ones.
+DRAWTEXT_ESCAPE_TABLE = str.maketrans({
+    '\r': None,  # Windows \r\n line endings leave \r after split by \n
+    '\\': '\\\\',  # Backslashes
+    ':': '\\:',  # FFmpeg uses : as parameter separator
+    "'": "'\\\\\\''",  # Single quotes for shell safety
+})
+
+# Shared pool bounding concurrent FFmpeg jobs (threads suffice - each job blocks on a subprocess)
+_WORKER_POOL = ThreadPoolExecutor(max_workers=Config.FFMPEG_WORKER_POOL, thread_name_prefix="ffmpeg")
+# Same bound for encodes run directly on the event loop (run_render_async)
+_RENDER_SLOTS = asyncio.Semaphore(Config.FFMPEG_WORKER_POOL)
+
 
 class FFmpegService:
     """Handles FFmpeg text overlay operations"""
 
-    @staticmethod
-    def check_ffmpeg_available() -> bool:
-        """Check if FFmpeg is installed and available"""
-        try:
-            result = subprocess.run(
-                ['ffmpeg', '-version'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+    # Cached result of check_ffmpeg_available (doesn't change during process lifetime)
+    _ffmpeg_available: Optional[bool] = None
+
+    @classmethod
+    def check_ffmpeg_available(cls) -> bool:
+        """Check if FFmpeg is installed and available (result is cached)"""
+        if cls._ffmpeg_available is None:
+            try:
+                result = subprocess.run(
+                    ['ffmpeg', '-version'],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=5
+                )
+                cls._ffmpeg_available = result.returncode == 0
+            except (FileNotFoundError, subprocess.TimeoutExpired):
+                cls._ffmpeg_available = False
+        return cls._ffmpeg_available
 
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def check_font_available(font_path: str) -> bool:
-        """Check if font file exists"""
+        """Check if font file exists (result is cached per path)"""
         return os.path.exists(font_path)
 
+    @staticmethod
+    def get_filesystem_type(path: str) -> Optional[str]:
+        """Return the filesystem type (e.g. 'tmpfs', 'ext4') holding path, None if unknown"""
+        path = os.path.realpath(path)
+        best_mount, best_type = "", None
+        try:
+            with open("/proc/self/mounts", encoding="utf-8") as mounts:
+                for line in mounts:
+                    fields = line.split()
+                    if len(fields) < 3:
+                        continue
+                    mount_point = fields[1].replace("\\040", " ")
+                    inside = path == mount_point or path.startswith(mount_point.rstrip("/") + "/")
+                    if inside and len(mount_point) >= len(best_mount):
+                        best_mount, best_type = mount_point, fields[2]
+        except OSError:
+            return None
+        return best_type
+
+    @staticmethod
+    def check_temp_dir() -> None:
+        """Log a warning if TEMP_DIR is disk-backed (downloads and intermediates then hit the disk)"""
+        fs_type = FFmpegService.get_filesystem_type(Config.TEMP_DIR)
+        if fs_type is None:
+            return
+        if fs_type in ("tmpfs", "ramfs"):
+            logger.info(f"TEMP_DIR {Config.TEMP_DIR} is on {fs_type}")
+        else:
+            logger.warning(
+                f"TEMP_DIR {Config.TEMP_DIR} is on {fs_type}, not tmpfs; downloads and "
+                f"intermediate files are written to disk (mount a tmpfs there to keep them in RAM)"
+            )
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget cached FFmpeg/font availability and hardware encoder detection"""
+        cls._ffmpeg_available = None
+        cls.check_font_available.cache_clear()
+        cls._detect_hw_encoder.cache_clear()
+
     @staticmethod
     def add_text_overlay(
         input_path: str,
@@ -48,7 +167,11 @@ class FFmpegService:
         template_name: str = "default",
         overrides: Optional[TextOverrideOptions] = None,
         apply_fade_out: bool = False,
-        fade_out_duration: float = 2.5
+        fade_out_duration: float = 2.5,
+        video_width: Optional[int] = None,
+        scale_to: Optional[Tuple[int, int]] = None,
+        trim: Optional[Tuple[float, float]] = None,
+        normalize_for_concat: bool = False
     ) -> Dict[str, Any]:
         """
         Add text overlay to video or image
@@ -61,111 +184,57 @@ class FFmpegService:
             overrides: Optional style overrides
             apply_fade_out: Whether to hide text in the final seconds
             fade_out_duration: Seconds before end to hide text (default 2.5)
+            video_width: Known width of input_path; skips ffprobe unless duration is needed
+            scale_to: Optional (width, height) to scale/pad the input to in the same
+                      FFmpeg pass (text is laid out for the scaled size)
+            trim: Optional (start_time, end_time) in seconds to cut the video to in
+                  the same FFmpeg pass
+            normalize_for_concat: Output the frame rate/pixel format merge_videos
+                                  normalizes to, so overlaid clips can be joined
+                                  with stream copy
 
         Returns:
             Dict with status and details
         """
         try:
-            # Normalize invisible/control newline variants so FFmpeg drawtext doesn't render them as BOX glyphs.
-            text = sanitize_unicode(text)
-
-            # Get base template
-            style = get_template(template_name)
-
-            # Apply overrides if provided
-            if overrides:
-                style = FFmpegService._apply_overrides(style, overrides)
-
-            # Get media dimensions for text wrapping
-            media_info = FFmpegService.get_media_info(input_path)
-            img_width = FFmpegService._get_video_width(media_info)
-            logger.info(f"[TEXT WRAP DEBUG] img_width from media: {img_width}")
-
-            # Calculate scaled font size based on video resolution
-            # This ensures consistent visual appearance across different resolutions
-            if img_width:
-                scale_factor = img_width / BASE_RESOLUTION_WIDTH
-                scaled_font_size = int(style.font_size * scale_factor)
-                logger.info(f"[FONT SCALING] Original font_size={style.font_size}, video_width={img_width}, scale_factor={scale_factor:.3f}, scaled_font_size={scaled_font_size}")
-            else:
-                # Fallback to original font size if width cannot be determined
-                scaled_font_size = style.font_size
-                logger.warning(f"[FONT SCALING] Could not determine video width, using original font_size={style.font_size}")
-
-            # Wrap text if max_text_width_percent is specified (override or template default)
-            max_text_width = overrides.max_text_width_percent if (overrides and overrides.max_text_width_percent) else style.max_text_width_percent
-            logger.info(f"[TEXT WRAP DEBUG] max_text_width_percent: override={overrides.max_text_width_percent if overrides else None}, style={style.max_text_width_percent}, final={max_text_width}")
-
-            if max_text_width and img_width:
-                logger.info(f"[TEXT WRAP DEBUG] Condition passed! Wrapping text to {max_text_width}% of {img_width}px")
-                text = FFmpegService._wrap_text(
-                    text,
-                    scaled_font_size,
-                    style.font_path,
-                    img_width,
-                    max_text_width
-                )
-                logger.info(f"[TEXT WRAP DEBUG] Wrapped text result:\n{text}")
-            else:
-                logger.warning(f"[TEXT WRAP DEBUG] Condition FAILED! max_text_width={max_text_width}, img_width={img_width} - text wrapping SKIPPED")
-
-            # Extract video duration if text hiding is requested
-            video_duration = None
-            if apply_fade_out:
-                if 'format' in media_info and 'duration' in media_info['format']:
-                    try:
-                        video_duration = float(media_info['format']['duration'])
-                        logger.info(f"Extracted video duration for text hiding: {video_duration}s")
-                    except (ValueError, TypeError) as e:
-                        logger.warning(f"Failed to parse video duration for text hiding: {e}")
-                        apply_fade_out = False
-                else:
-                    logger.warning("Video duration not available, skipping text hiding")
-                    apply_fade_out = False
-
-            # Write text to temp file for FFmpeg textfile parameter
-            # Using textfile= instead of text= bypasses FFmpeg multiline rendering bugs
-            text_file_path = FFmpegService._write_text_file(text)
-            logger.info(f"Created temp text file for FFmpeg: {text_file_path}")
+            filter_str, text_file_path = FFmpegService._prepare_overlay_filter(
+                input_path,
+                text,
+                template_name=template_name,
+                overrides=overrides,
+                apply_fade_out=apply_fade_out,
+                fade_out_duration=fade_out_duration,
+                video_width=video_width,
+                scale_to=scale_to,
+                trim=trim,
+                normalize_for_concat=normalize_for_concat
+            )
 
             try:
-                # Build FFmpeg filter using textfile path
-                filter_str = FFmpegService._build_drawtext_filter(
-                    text_file_path,
-                    style,
-                    overrides,
-                    scaled_font_size=scaled_font_size,
-                    fade_out_duration=fade_out_duration if apply_fade_out else None,
-                    video_duration=video_duration if apply_fade_out else None
-                )
-
                 # Determine if input is image or video
                 is_image = FFmpegService._is_image(input_path)
 
                 # Build FFmpeg command
                 cmd = FFmpegService._build_ffmpeg_command(
-                    input_path, output_path, filter_str, is_image
+                    input_path, output_path, filter_str, is_image, trim=trim
                 )
 
-                logger.info(f"Running FFmpeg command: {' '.join(cmd)}")
+                logger.info("Running FFmpeg command")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("FFmpeg command: %s", " ".join(cmd))
 
                 # Execute FFmpeg
-                process = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=120  # 2 minute timeout
-                )
+                returncode, stderr, _ = FFmpegService._run_ffmpeg(cmd, timeout=120)  # 2 minute timeout
 
-                if process.returncode != 0:
-                    logger.error(f"FFmpeg error: {process.stderr}")
-                    raise Exception(f"FFmpeg processing failed: {process.stderr}")
+                if returncode != 0:
+                    logger.error(f"FFmpeg error: {stderr}")
+                    raise Exception(f"FFmpeg processing failed: {stderr}")
 
                 # Verify output file was created
-                if not os.path.exists(output_path):
+                try:
+                    output_size = os.stat(output_path).st_size
+                except FileNotFoundError:
                     raise Exception("Output file was not created")
-
-                output_size = os.path.getsize(output_path)
                 logger.info(f"Successfully created output file: {output_path} ({output_size} bytes)")
 
                 return {
@@ -180,22 +249,181 @@ class FFmpegService:
 
             finally:
                 # Clean up temp text file
-                if os.path.exists(text_file_path):
-                    try:
-                        os.remove(text_file_path)
-                        logger.debug(f"Cleaned up temp text file: {text_file_path}")
-                    except Exception as cleanup_err:
-                        logger.warning(f"Failed to clean up temp text file {text_file_path}: {cleanup_err}")
+                try:
+                    os.remove(text_file_path)
+                    logger.debug(f"Cleaned up temp text file: {text_file_path}")
+                except FileNotFoundError:
+                    pass
+                except Exception as cleanup_err:
+                    logger.warning(f"Failed to clean up temp text file {text_file_path}: {cleanup_err}")
 
         except Exception as e:
             logger.error(f"Error adding text overlay: {str(e)}")
             raise
 
+    @staticmethod
+    def _prepare_overlay_filter(
+        input_path: str,
+        text: str,
+        template_name: str = "default",
+        overrides: Optional[TextOverrideOptions] = None,
+        apply_fade_out: bool = False,
+        fade_out_duration: float = 2.5,
+        video_width: Optional[int] = None,
+        scale_to: Optional[Tuple[int, int]] = None,
+        trim: Optional[Tuple[float, float]] = None,
+        normalize_for_concat: bool = False
+    ) -> Tuple[str, str]:
+        """
+        Resolve the style, wrap the text and build the overlay filter chain for one input
+
+        Arguments match add_text_overlay.
+
+        Returns:
+            Tuple of (filter chain, temp text file path); the caller removes the text file
+        """
+        # Normalize invisible/control newline variants so FFmpeg drawtext doesn't render them as BOX glyphs.
+        text = sanitize_unicode(text)
+
+        # Get base template
+        style = get_template(template_name)
+
+        # Apply overrides if provided
+        if overrides:
+            style = FFmpegService._apply_overrides(style, overrides)
+
+        # Get media dimensions for text wrapping (only spawn ffprobe if the caller
+        # didn't supply the width or we need the duration for text hiding)
+        media_info = {}
+        img_width = scale_to[0] if scale_to else video_width
+        if img_width is None or (apply_fade_out and not trim):
+            media_info = FFmpegService.get_media_info(input_path)
+            if img_width is None:
+                img_width = FFmpegService._get_video_width(media_info)
+        logger.info(f"[TEXT WRAP DEBUG] img_width from media: {img_width}")
+
+        # Calculate scaled font size based on video resolution
+        # This ensures consistent visual appearance across different resolutions
+        if img_width:
+            scale_factor = img_width / BASE_RESOLUTION_WIDTH
+            scaled_font_size = int(style.font_size * scale_factor)
+            logger.info(f"[FONT SCALING] Original font_size={style.font_size}, video_width={img_width}, scale_factor={scale_factor:.3f}, scaled_font_size={scaled_font_size}")
+        else:
+            # Fallback to original font size if width cannot be determined
+            scaled_font_size = style.font_size
+            logger.warning(f"[FONT SCALING] Could not determine video width, using original font_size={style.font_size}")
+
+        # Wrap text if max_text_width_percent is specified (override or template default)
+        max_text_width = overrides.max_text_width_percent if (overrides and overrides.max_text_width_percent) else style.max_text_width_percent
+        logger.info(f"[TEXT WRAP DEBUG] max_text_width_percent: override={overrides.max_text_width_percent if overrides else None}, style={style.max_text_width_percent}, final={max_text_width}")
+
+        if max_text_width and img_width:
+            logger.info(f"[TEXT WRAP DEBUG] Condition passed! Wrapping text to {max_text_width}% of {img_width}px")
+            text = FFmpegService._wrap_text(
+                text,
+                scaled_font_size,
+                style.font_path,
+                img_width,
+                max_text_width
+            )
+            logger.info(f"[TEXT WRAP DEBUG] Wrapped text result:\n{text}")
+        else:
+            logger.warning(f"[TEXT WRAP DEBUG] Condition FAILED! max_text_width={max_text_width}, img_width={img_width} - text wrapping SKIPPED")
+
+        # Extract video duration if text hiding is requested
+        video_duration = None
+        if apply_fade_out and trim:
+            # Timestamps restart at 0 after input seeking, so the trimmed length is the duration
+            video_duration = trim[1] - trim[0]
+        elif apply_fade_out:
+            if 'format' in media_info and 'duration' in media_info['format']:
+                try:
+                    video_duration = float(media_info['format']['duration'])
+                    logger.info(f"Extracted video duration for text hiding: {video_duration}s")
+                except (ValueError, TypeError) as e:
+                    logger.warning(f"Failed to parse video duration for text hiding: {e}")
+                    apply_fade_out = False
+            else:
+                logger.warning("Video duration not available, skipping text hiding")
+                apply_fade_out = False
+
+        # Write text to temp file for FFmpeg textfile parameter
+        # Using textfile= instead of text= bypasses FFmpeg multiline rendering bugs
+        text_file_path = FFmpegService._write_text_file(text)
+        logger.info(f"Created temp text file for FFmpeg: {text_file_path}")
+
+        try:
+            # Build FFmpeg filter using textfile path
+            filter_str = FFmpegService._build_drawtext_filter(
+                text_file_path,
+                style,
+                overrides,
+                scaled_font_size=scaled_font_size,
+                fade_out_duration=fade_out_duration if apply_fade_out else None,
+                video_duration=video_duration if apply_fade_out else None
+            )
+
+            # Scale in the same filtergraph so the video is only decoded/encoded once
+            if scale_to:
+                filter_str = f"{FFmpegService._scale_pad_filter(*scale_to)},{filter_str}"
+
+            if normalize_for_concat:
+                filter_str = f"{filter_str},{CONCAT_NORMALIZE_FILTER}"
+        except Exception:
+            os.remove(text_file_path)
+            raise
+
+        return filter_str, text_file_path
+
+    @staticmethod
+    async def add_text_overlay_async(*args, **kwargs) -> Dict[str, Any]:
+        """
+        Run add_text_overlay on the shared FFmpeg worker pool
+
+        Takes the same arguments as add_text_overlay. The pool bounds how many
+        overlays encode at once across requests, and the event loop stays free
+        while FFmpeg runs.
+        """
+        return await FFmpegService._run_in_worker_pool(FFmpegService.add_text_overlay, *args, **kwargs)
+
+    @staticmethod
+    async def merge_videos_async(*args, **kwargs) -> Dict[str, Any]:
+        """Run merge_videos on the shared FFmpeg worker pool (same arguments)"""
+        return await FFmpegService._run_in_worker_pool(FFmpegService.merge_videos, *args, **kwargs)
+
+    @staticmethod
+    async def overlay_and_merge_async(*args, **kwargs) -> Dict[str, Any]:
+        """Run overlay_and_merge on the shared FFmpeg worker pool (same arguments)"""
+        return await FFmpegService._run_in_worker_pool(FFmpegService.overlay_and_merge, *args, **kwargs)
+
+    @staticmethod
+    async def scale_video_async(*args, **kwargs) -> Dict[str, Any]:
+        """Run scale_video on the shared FFmpeg worker pool (same arguments)"""
+        return await FFmpegService._run_in_worker_pool(FFmpegService.scale_video, *args, **kwargs)
+
+    @staticmethod
+    async def merge_videos_streaming_async(*args, **kwargs) -> Dict[str, Any]:
+        """Run merge_videos_streaming on the shared FFmpeg worker pool (same arguments)"""
+        return await FFmpegService._run_in_worker_pool(FFmpegService.merge_videos_streaming, *args, **kwargs)
+
+    @staticmethod
+    async def _run_in_worker_pool(func, *args, **kwargs):
+        """Run a blocking FFmpeg operation on _WORKER_POOL without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_WORKER_POOL, functools.partial(func, *args, **kwargs))
+
     @staticmethod
     def _apply_overrides(style: TextStyle, overrides: TextOverrideOptions) -> TextStyle:
         """Apply override options to base style"""
         # Create a copy of the style
-        override_dict = overrides.model_dump(exclude_none=True)
+        style = copy.copy(style)
+
+        # Only the fields the client set (every default is None), without a full model_dump()
+        override_dict = {
+            key: getattr(overrides, key)
+            for key in overrides.model_fields_set
+            if getattr(overrides, key) is not None
+        }
 
         # Handle font weight override (preferred method)
         if 'font_weight' in override_dict:
@@ -233,16 +461,8 @@ class FFmpegService:
         Returns:
             Escaped text safe for FFmpeg's text parameter
         """
-        # Remove carriage returns (Windows \r\n line endings leave \r after split by \n)
-        text = text.replace('\r', '')
-        # Escape backslashes first (must be done before other escapes)
-        text = text.replace('\\', '\\\\')
-        # Escape colons (FFmpeg uses : as parameter separator)
-        text = text.replace(':', '\\:')
-        # Escape single quotes for shell safety
-        text = text.replace("'", "'\\\\\\''")
         # Newlines are kept as-is - FFmpeg interprets \\n as line breaks in text parameter
-        return text
+        return text.translate(DRAWTEXT_ESCAPE_TABLE)
 
     @staticmethod
     def _write_text_file(text: str, temp_dir: str = None) -> str:
@@ -251,15 +471,14 @@ class FFmpegService:
         ZERO preprocessing - matches working outfit_service.py exactly.
         Preprocessing CAUSES BOX symbols, not fixes them!
         """
-        tmp = tempfile.NamedTemporaryFile(
+        with tempfile.NamedTemporaryFile(
             delete=False,
             suffix=".txt",
             mode="w",
-            encoding="utf-8"
-        )
-        tmp.write(text)
-        tmp.flush()
-        tmp.close()
+            encoding="utf-8",
+            dir=temp_dir or Config.TEXT_TEMP_DIR
+        ) as tmp:
+            tmp.write(text)
         return tmp.name
 
     @staticmethod
@@ -278,27 +497,36 @@ class FFmpegService:
         x, y = FFmpegService._calculate_position(style, overrides)
         font_size = scaled_font_size if scaled_font_size is not None else style.font_size
 
+        # Alpha for text disappearance if requested (goes right before x/y)
+        alpha = ""
+        if fade_out_duration is not None and video_duration is not None:
+            cutoff_time = video_duration - fade_out_duration
+            alpha = f"alpha='if(lt(t\\,{cutoff_time})\\,1\\,0)':"
+            logger.info(f"Text will disappear at {cutoff_time}s (last {fade_out_duration}s hidden)")
+
+        style_options = FFmpegService._drawtext_style_options(
+            font_size, style.border_width, style.shadow_x, style.shadow_y
+        )
+
         # Build EXACTLY like outfit_service.py - single f-string, NAMED colors, NO hex
         # This is the ONLY pattern that works for multiline text without BOX symbols
         filter_str = (
             f"drawtext=fontfile='{style.font_path}':textfile='{textfile_path}':"
-            f"fontsize={font_size}:fontcolor=white:bordercolor=black:borderw={style.border_width}:"
-            f"shadowcolor=black@0.6:shadowx={style.shadow_x}:shadowy={style.shadow_y}:"
-            f"text_align=center:x={x}:y={y}"
+            f"{style_options}:{alpha}x={x}:y={y}"
         )
 
-        # Add alpha for text disappearance if requested
-        if fade_out_duration is not None and video_duration is not None:
-            cutoff_time = video_duration - fade_out_duration
-            # Insert alpha parameter before the closing
-            filter_str = filter_str.replace(
-                f":x={x}:y={y}",
-                f":alpha='if(lt(t\\,{cutoff_time})\\,1\\,0)':x={x}:y={y}"
-            )
-            logger.info(f"Text will disappear at {cutoff_time}s (last {fade_out_duration}s hidden)")
-
         return filter_str
 
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _drawtext_style_options(font_size: int, border_width: int, shadow_x: int, shadow_y: int) -> str:
+        """drawtext styling options, identical for every overlay with the same size and style"""
+        return (
+            f"fontsize={font_size}:fontcolor=white:bordercolor=black:borderw={border_width}:"
+            f"shadowcolor=black@0.6:shadowx={shadow_x}:shadowy={shadow_y}:"
+            f"text_align=center"
+        )
+
     @staticmethod
     def _calculate_position(
         style: TextStyle,
@@ -309,77 +537,75 @@ class FFmpegService:
         if overrides and overrides.position:
             position = overrides.position
 
-        # Position presets
-        positions = {
-            "center": ("(w-text_w)/2", "(h-text_h)/2"),
-            "top-left": ("10", "10"),
-            "top-right": ("w-text_w-10", "10"),
-            "top-center": ("(w-text_w)/2", "10"),
-            "bottom-left": ("10", "h-text_h-10"),
-            "bottom-right": ("w-text_w-10", "h-text_h-10"),
-            "bottom-center": ("(w-text_w)/2", "h-text_h-10"),
-            "middle-left": ("10", "(h-text_h)/2"),
-            "middle-right": ("w-text_w-10", "(h-text_h)/2"),
-        }
-
         if position == "custom" and overrides:
             if overrides.custom_x is not None and overrides.custom_y is not None:
                 return (str(overrides.custom_x), str(overrides.custom_y))
 
-        return positions.get(position, positions["center"])
+        return POSITIONS.get(position, POSITIONS["center"])
 
     @staticmethod
     def _convert_color(color: str) -> str:
         """Convert color name or hex to FFmpeg format"""
-        color_map = {
-            'white': '0xFFFFFF',
-            'black': '0x000000',
-            'red': '0xFF0000',
-            'green': '0x00FF00',
-            'blue': '0x0000FF',
-            'yellow': '0xFFFF00',
-            'cyan': '0x00FFFF',
-            'magenta': '0xFF00FF',
-            'orange': '0xFFA500',
-            'purple': '0x800080',
-            'pink': '0xFFC0CB',
-            'gray': '0x808080',
-            'grey': '0x808080'
-        }
-
-        color_lower = color.lower()
-        if color_lower in color_map:
-            return color_map[color_lower]
-
         # Handle hex colors
         if color.startswith('#'):
             return '0x' + color[1:]
 
+        # Template colors are normally lowercase already; only fold case on a miss
+        converted = COLOR_MAP.get(color)
+        if converted is None:
+            converted = COLOR_MAP.get(color.lower())
+        if converted is not None:
+            return converted
+
         # Default to white if unknown
         return '0xFFFFFF'
 
     @staticmethod
     def _is_image(file_path: str) -> bool:
         """Check if file is an image based on extension"""
-        image_extensions = {'.jpg', '.jpeg', '.png'}
-        ext = Path(file_path).suffix.lower()
-        return ext in image_extensions
+        ext = os.path.splitext(file_path)[1].lower()
+        return ext in IMAGE_EXTENSIONS
 
     @staticmethod
     def _build_ffmpeg_command(
         input_path: str,
         output_path: str,
         filter_str: str,
-        is_image: bool
+        is_image: bool,
+        trim: Optional[Tuple[float, float]] = None,
+        output_format: Optional[str] = None
     ) -> list:
         """Build complete FFmpeg command using filter_complex (matches outfit_service)"""
-        cmd = ['ffmpeg', '-y', '-i', input_path]
+        cmd = ['ffmpeg', '-y', *FFmpegService._filter_thread_args()]
 
         # Use -filter_complex instead of -vf to match outfit_service
         # This fixes BOX symbols appearing at end of lines in multiline text
         filter_complex = f"[0:v]{filter_str}[vout]"
 
-        if is_image:
+        if not is_image and FFmpegService._use_cuda_pipeline():
+            # Decode on the GPU, drawtext on system memory, encode from GPU memory
+            cmd.extend(['-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda'])
+            filter_complex = f"[0:v]hwdownload,format=nv12,{filter_str},hwupload_cuda[vout]"
+
+        if trim and not is_image:
+            # Input seeking: decoding starts at the nearest keyframe and output is still frame-accurate
+            cmd.extend(['-ss', str(trim[0])])
+
+        cmd.extend(['-i', input_path])
+
+        if is_image and not FFmpegService._is_image(output_path):
+            # Still image rendered into a one-frame video. yuv420p keeps it playable in
+            # browsers/iOS (RGB input would otherwise give High 4:4:4); it needs even
+            # dimensions, so pad odd-sized images by one pixel first
+            cmd.extend([
+                '-filter_complex', f"[0:v]{filter_str},pad=ceil(iw/2)*2:ceil(ih/2)*2,format=yuv420p[vout]",
+                '-map', '[vout]',
+                '-frames:v', '1',
+                *FFmpegService._video_codec_args(Config.LIBX264_CRF),
+                '-movflags', '+faststart',
+                output_path
+            ])
+        elif is_image:
             # For images, use filter_complex for consistent text rendering
             cmd.extend([
                 '-filter_complex', filter_complex,
@@ -393,37 +619,175 @@ class FFmpegService:
                 '-filter_complex', filter_complex,
                 '-map', '[vout]',
                 '-map', '0:a?',  # Map audio if exists (? = optional, won't fail if no audio)
-                '-c:v', 'libx264',  # H.264 video codec
-                '-preset', 'slow',  # Encoding speed/quality tradeoff (slow = better quality)
-                '-crf', '18',  # Constant Rate Factor (18 = high quality, lower = better)
+                *FFmpegService._video_codec_args(Config.LIBX264_CRF),  # H.264 video codec
                 '-c:a', 'aac',  # AAC audio codec
                 '-b:a', '192k',  # Audio bitrate (higher quality audio)
-                '-movflags', '+faststart',  # Enable streaming
-                output_path
             ])
+            if output_format:
+                # Non-seekable output (e.g. a pipe): no faststart rewrite possible
+                cmd.extend(['-f', output_format])
+            else:
+                cmd.extend(['-movflags', '+faststart'])  # Enable streaming
+            if trim:
+                cmd.extend(['-t', str(trim[1] - trim[0])])
+            cmd.append(output_path)
 
         return cmd
 
+    @staticmethod
+    def _video_codec_args(crf: str) -> List[str]:
+        """
+        Build H.264 encoder arguments for the configured encoder.
+
+        Args:
+            crf: libx264 CRF value; mapped to the equivalent constant-quality
+                 option for hardware encoders
+
+        Returns:
+            FFmpeg output arguments selecting and tuning the video encoder
+        """
+        encoder = Config.VIDEO_ENCODER
+        if encoder == 'auto':
+            encoder = FFmpegService._detect_hw_encoder()
+
+        if encoder == 'h264_nvenc':
+            return ['-c:v', 'h264_nvenc', '-preset', 'p4', '-cq', crf]
+        if encoder == 'h264_qsv':
+            return ['-c:v', 'h264_qsv', '-global_quality', crf]
+        if encoder == 'h264_amf':
+            return ['-c:v', 'h264_amf', '-rc', 'cqp', '-qp_i', crf, '-qp_p', crf]
+        if encoder == 'h264_videotoolbox':
+            # VideoToolbox quality is 1-100 (higher = better)
+            quality = max(1, min(100, 100 - 2 * int(crf)))
+            # allow_sw: fall back to Apple's software encoder when the hardware one is busy
+            return ['-c:v', 'h264_videotoolbox', '-q:v', str(quality), '-allow_sw', '1']
+        if encoder != 'libx264':
+            return ['-c:v', encoder]
+        return [
+            '-c:v', 'libx264',
+            '-preset', Config.LIBX264_PRESET,
+            '-crf', crf,
+            '-threads', str(Config.FFMPEG_THREADS)
+        ]
+
+    @staticmethod
+    def _use_cuda_pipeline() -> bool:
+        """Whether overlay re-encodes should keep decode/encode on the GPU"""
+        if not Config.FFMPEG_HWACCEL:
+            return False
+        encoder = Config.VIDEO_ENCODER
+        if encoder == 'auto':
+            encoder = FFmpegService._detect_hw_encoder()
+        return encoder == 'h264_nvenc'
+
+    @staticmethod
+    def _filter_thread_args() -> List[str]:
+        """Global filtergraph thread options (FFmpeg already defaults to all cores)"""
+        if Config.FFMPEG_THREADS <= 0:
+            return []
+        threads = str(Config.FFMPEG_THREADS)
+        return ['-filter_threads', threads, '-filter_complex_threads', threads]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _detect_hw_encoder() -> str:
+        """Return the first usable hardware H.264 encoder, falling back to libx264"""
+        try:
+            result = subprocess.run(
+                ['ffmpeg', '-hide_banner', '-encoders'],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return 'libx264'
+
+        for encoder in HW_H264_ENCODERS:
+            if encoder in result.stdout and FFmpegService._encoder_works(encoder):
+                logger.info(f"Using hardware video encoder: {encoder}")
+                return encoder
+
+        logger.info("No usable hardware video encoder found, using libx264")
+        return 'libx264'
+
+    @staticmethod
+    def _encoder_works(encoder: str) -> bool:
+        """Test-encode a single frame (encoders are listed even when the hardware is missing)"""
+        cmd = [
+            'ffmpeg', '-hide_banner', '-v', 'error',
+            '-f', 'lavfi', '-i', 'color=c=black:s=256x256:d=0.1',
+            '-frames:v', '1',
+            '-c:v', encoder,
+            '-f', 'null', '-'
+        ]
+        try:
+            return subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=15
+            ).returncode == 0
+        except subprocess.TimeoutExpired:
+            return False
+
     @staticmethod
     def get_media_info(file_path: str) -> Dict[str, Any]:
-        """Get basic media information using ffprobe"""
+        """
+        Get basic media information using ffprobe
+
+        Successful probes are cached per (path, mtime, size), so repeated probes of
+        an unchanged file don't spawn ffprobe again. The returned dict is shared
+        between callers and must not be mutated.
+        """
         try:
-            cmd = [
-                'ffprobe',
-                '-v', 'quiet',
-                '-print_format', 'json',
-                '-show_format',
-                '-show_streams',
-                file_path
-            ]
+            stat = os.stat(file_path)
+        except OSError as e:
+            logger.warning(f"Failed to get media info: {str(e)}")
+            return {}
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        try:
+            return FFmpegService._get_media_info_cached(
+                os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size
+            )
+        except LookupError:
+            # Failed probes are not cached
+            return {}
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _get_media_info_cached(file_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+        """Probe file_path; mtime_ns and size are only part of the cache key"""
+        # Capped probe first; fall back to ffprobe defaults if it came back incomplete
+        media_info = FFmpegService._run_ffprobe(file_path, [
+            '-probesize', str(Config.FFPROBE_PROBESIZE),
+            '-analyzeduration', str(Config.FFPROBE_ANALYZEDURATION),
+        ])
+        if FFmpegService._is_probe_complete(media_info, file_path):
+            return media_info
+
+        logger.info(f"Capped ffprobe was incomplete for {file_path}, retrying with defaults")
+        media_info = FFmpegService._run_ffprobe(file_path, [])
+        if not media_info:
+            raise LookupError(f"ffprobe returned no media info for {file_path}")
+        return media_info
+
+    @staticmethod
+    def clear_media_info_cache() -> None:
+        """Drop all cached ffprobe results"""
+        FFmpegService._get_media_info_cached.cache_clear()
+
+    @staticmethod
+    def _run_ffprobe(file_path: str, probe_args: List[str]) -> Dict[str, Any]:
+        """Run ffprobe with the given extra input options and parse its JSON output"""
+        try:
+            cmd = FFmpegService._ffprobe_command(file_path, probe_args)
+
+            result = subprocess.run(cmd, capture_output=True, timeout=30)
 
             if result.returncode == 0:
-                import json
                 return json.loads(result.stdout)
             else:
-                logger.error(f"ffprobe failed for {file_path}: {result.stderr}")
+                logger.error(f"ffprobe failed for {file_path}: {result.stderr.decode(errors='replace')}")
                 return {}
 
         except Exception as e:
@@ -431,30 +795,277 @@ class FFmpegService:
             return {}
 
     @staticmethod
-    def _get_video_width(media_info: Dict[str, Any]) -> Optional[int]:
-        """Extract video/image width from media info"""
+    async def get_media_info_async(file_path: str) -> Dict[str, Any]:
+        """Async variant of get_media_info that doesn't block the event loop"""
+        media_info = await FFmpegService._run_ffprobe_async(file_path, [
+            '-probesize', str(Config.FFPROBE_PROBESIZE),
+            '-analyzeduration', str(Config.FFPROBE_ANALYZEDURATION),
+        ])
+        if FFmpegService._is_probe_complete(media_info, file_path):
+            return media_info
+
+        logger.info(f"Capped ffprobe was incomplete for {file_path}, retrying with defaults")
+        return await FFmpegService._run_ffprobe_async(file_path, [])
+
+    @staticmethod
+    async def _run_ffprobe_async(file_path: str, probe_args: List[str]) -> Dict[str, Any]:
+        """Async variant of _run_ffprobe"""
         try:
-            if 'streams' in media_info:
-                for stream in media_info['streams']:
-                    if stream.get('codec_type') == 'video' and 'width' in stream:
-                        return int(stream['width'])
-            return None
+            cmd = FFmpegService._ffprobe_command(file_path, probe_args)
+            returncode, stdout, stderr = await FFmpegService.run_ffmpeg_async(cmd, timeout=30)
+
+            if returncode == 0:
+                return json.loads(stdout)
+            else:
+                logger.error(f"ffprobe failed for {file_path}: {stderr.decode(errors='replace')}")
+                return {}
+
         except Exception as e:
-            logger.warning(f"Failed to extract video width: {str(e)}")
-            return None
+            logger.warning(f"Failed to get media info: {str(e)}")
+            return {}
 
     @staticmethod
-    def _get_video_height(media_info: Dict[str, Any]) -> Optional[int]:
-        """Extract video/image height from media info"""
+    def _ffprobe_command(file_path: str, probe_args: List[str]) -> List[str]:
+        """Build the ffprobe command used by get_media_info"""
+        return [
+            'ffprobe',
+            '-v', 'quiet',
+            *probe_args,
+            '-print_format', 'json=compact=1',
+            '-show_entries', FFPROBE_ENTRIES,
+            file_path
+        ]
+
+    @staticmethod
+    def _run_ffmpeg(
+        cmd: List[str],
+        timeout: float,
+        stall_timeout: Optional[float] = None,
+        pass_fds: Tuple[int, ...] = ()
+    ) -> Tuple[int, str, Dict[str, str]]:
+        """
+        Run an ffmpeg command, keeping only the tail of its stderr
+
+        Progress output is suppressed at the source (-nostats -loglevel error) and
+        stderr is drained into a bounded ring buffer instead of being buffered
+        and decoded in full. Machine-readable progress (-progress pipe:1) is read
+        from stdout, keeping the latest value of each key. A process that stops
+        reporting progress for stall_timeout seconds is treated as hung.
+
+        Args:
+            cmd: ffmpeg command and arguments
+            timeout: Seconds before the process is killed regardless of progress
+            stall_timeout: Seconds without progress before the process is killed
+                           (default FFMPEG_STALL_TIMEOUT; <= 0 disables stall detection)
+            pass_fds: File descriptors the process inherits (for pipe:N outputs)
+
+        Returns:
+            Tuple of (returncode, last stderr lines, final progress report)
+
+        Raises:
+            subprocess.TimeoutExpired: If the process exceeded the timeout or stalled (it is killed)
+        """
+        cmd = [cmd[0], '-nostats', '-loglevel', 'error', '-progress', 'pipe:1', *cmd[1:]]
+        stderr_tail = deque(maxlen=200)
+        progress: Dict[str, str] = {}
+        last_progress = [time.monotonic()]
+        if stall_timeout is None:
+            stall_timeout = Config.FFMPEG_STALL_TIMEOUT
+
+        def read_progress(stream):
+            for line in stream:
+                last_progress[0] = time.monotonic()
+                key, sep, value = line.decode("utf-8", errors="replace").partition("=")
+                if sep:
+                    progress[key.strip()] = value.strip()
+
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            pass_fds=pass_fds
+        )
+        readers = [
+            threading.Thread(target=stderr_tail.extend, args=(process.stderr,), daemon=True),
+            threading.Thread(target=read_progress, args=(process.stdout,), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+        deadline = time.monotonic() + timeout
         try:
-            if 'streams' in media_info:
-                for stream in media_info['streams']:
-                    if stream.get('codec_type') == 'video' and 'height' in stream:
-                        return int(stream['height'])
+            while process.poll() is None:
+                now = time.monotonic()
+                stalled = stall_timeout > 0 and now - last_progress[0] > stall_timeout
+                if now >= deadline or stalled:
+                    if stalled:
+                        logger.warning(f"FFmpeg made no progress for {stall_timeout}s, killing it")
+                    process.kill()
+                    process.wait()
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+                try:
+                    process.wait(timeout=min(1.0, deadline - now))
+                except subprocess.TimeoutExpired:
+                    pass
+        finally:
+            for reader in readers:
+                reader.join()
+            process.stdout.close()
+            process.stderr.close()
+
+        return process.returncode, b"".join(stderr_tail).decode("utf-8", errors="replace"), progress
+
+    @staticmethod
+    def _progress_duration(progress: Optional[Dict[str, str]]) -> Optional[float]:
+        """Output duration in seconds from an ffmpeg -progress report, if available"""
+        if not progress:
             return None
-        except Exception as e:
-            logger.warning(f"Failed to extract video height: {str(e)}")
+        # out_time_ms is actually in microseconds too (long-standing FFmpeg quirk)
+        value = progress.get('out_time_us') or progress.get('out_time_ms')
+        try:
+            duration = int(value) / 1_000_000
+        except (TypeError, ValueError):
             return None
+        return duration if duration > 0 else None
+
+    @staticmethod
+    async def _drain_stderr(stream: asyncio.StreamReader, ring: deque) -> None:
+        """Read a process's stderr to EOF, keeping only the chunks that fit in the ring"""
+        while True:
+            chunk = await stream.read(4096)
+            if not chunk:
+                return
+            ring.append(chunk)
+
+    @staticmethod
+    async def run_ffmpeg_async(cmd: List[str], timeout: float) -> Tuple[int, bytes, bytes]:
+        """
+        Run an ffmpeg/ffprobe command without blocking the event loop
+
+        stdout is returned in full (ffprobe JSON); stderr is drained concurrently
+        into a bounded ring buffer so only its last ~100 KB is kept.
+
+        Args:
+            cmd: Command and arguments
+            timeout: Seconds before the process is killed
+
+        Returns:
+            Tuple of (returncode, stdout, stderr tail)
+
+        Raises:
+            asyncio.TimeoutError: If the process exceeded the timeout (it is killed and reaped)
+        """
+        stderr_tail = deque(maxlen=25)
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(
+                asyncio.gather(
+                    process.stdout.read(),
+                    FFmpegService._drain_stderr(process.stderr, stderr_tail)
+                ),
+                timeout
+            )
+            await process.wait()
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+        return process.returncode, stdout, b"".join(stderr_tail)
+
+    @staticmethod
+    async def run_render_async(cmd: List[str], timeout: float) -> Tuple[int, bytes, bytes]:
+        """
+        Run an ffmpeg encode with run_ffmpeg_async, at most FFMPEG_WORKER_POOL at a time
+
+        Waiting for a slot does not count towards the timeout.
+        """
+        async with _RENDER_SLOTS:
+            return await FFmpegService.run_ffmpeg_async(cmd, timeout=timeout)
+
+    @staticmethod
+    def _is_probe_complete(media_info: Dict[str, Any], file_path: str) -> bool:
+        """Check that a probe has the fields callers rely on (dimensions, and duration for videos)"""
+        streams = media_info.get('streams')
+        if not streams:
+            return False
+        if any(s.get('codec_type') == 'video' and 'width' not in s for s in streams):
+            return False
+        if not FFmpegService._is_image(file_path) and 'duration' not in media_info.get('format', {}):
+            return False
+        return True
+
+    @staticmethod
+    def get_media_info_batch(file_paths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Probe several files concurrently.
+
+        ffprobe only accepts a single input, so each file still gets its own
+        process, but the probes run in parallel instead of back-to-back.
+
+        Args:
+            file_paths: Paths to probe
+
+        Returns:
+            List of media info dicts in the same order as file_paths
+        """
+        if not file_paths:
+            return []
+        if len(file_paths) == 1:
+            return [FFmpegService.get_media_info(file_paths[0])]
+
+        with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+            return list(executor.map(FFmpegService.get_media_info, file_paths))
+
+    @staticmethod
+    def _extract_stream_summary(media_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Collect the media facts callers need in a single pass over the streams.
+
+        Returns:
+            Dict with video_width, video_height, has_audio and duration
+            (None/False for anything missing or unparseable)
+        """
+        summary = {'video_width': None, 'video_height': None, 'has_audio': False, 'duration': None}
+
+        for stream in media_info.get('streams', ()):
+            codec_type = stream.get('codec_type')
+            if codec_type == 'video':
+                if summary['video_width'] is None and 'width' in stream:
+                    try:
+                        summary['video_width'] = int(stream['width'])
+                    except (ValueError, TypeError) as e:
+                        logger.warning(f"Failed to extract video width: {str(e)}")
+                if summary['video_height'] is None and 'height' in stream:
+                    try:
+                        summary['video_height'] = int(stream['height'])
+                    except (ValueError, TypeError) as e:
+                        logger.warning(f"Failed to extract video height: {str(e)}")
+            elif codec_type == 'audio':
+                summary['has_audio'] = True
+
+        duration = media_info.get('format', {}).get('duration')
+        if duration is not None:
+            try:
+                summary['duration'] = float(duration)
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Failed to extract duration: {str(e)}")
+
+        return summary
+
+    @staticmethod
+    def _get_video_width(media_info: Dict[str, Any]) -> Optional[int]:
+        """Extract video/image width from media info"""
+        return FFmpegService._extract_stream_summary(media_info)['video_width']
+
+    @staticmethod
+    def _get_video_height(media_info: Dict[str, Any]) -> Optional[int]:
+        """Extract video/image height from media info"""
+        return FFmpegService._extract_stream_summary(media_info)['video_height']
 
     @staticmethod
     def _wrap_text(
@@ -468,8 +1079,6 @@ class FFmpegService:
         Wrap text using textwrap.wrap() - matches working outfit_service pattern.
         NO preprocessing - that causes BOX symbols!
         """
-        import textwrap
-
         if not text:
             return ""
 
@@ -503,10 +1112,8 @@ class FFmpegService:
         Returns:
             Dict with success status and new duration
         """
-        import asyncio
-
-        # Get original duration (get_media_info is synchronous)
-        media_info = self.get_media_info(input_path)
+        # Get original duration
+        media_info = await self.get_media_info_async(input_path)
         original_duration = float(media_info['format']['duration'])
 
         # Validate: can't extend, only trim
@@ -514,54 +1121,78 @@ class FFmpegService:
             logger.info(f"Target duration {target_duration}s >= original {original_duration}s, skipping trim")
             return {"trimmed": False, "duration": original_duration}
 
-        # Calculate trim amounts
-        trim_total = original_duration - target_duration
+        start_time, end_time = FFmpegService._trim_window(original_duration, target_duration, trim_mode)
 
-        if trim_mode == "start":
-            start_time = trim_total
-            end_time = original_duration
-        elif trim_mode == "end":
-            start_time = 0
-            end_time = target_duration
-        else:  # "both"
-            start_time = trim_total / 2
-            end_time = original_duration - (trim_total / 2)
-
-        # FFmpeg trim command with accurate seeking (-ss after -i)
-        cmd = [
-            'ffmpeg', '-y',
-            '-i', input_path,
-            '-ss', str(start_time),
-            '-to', str(end_time),
-            '-c:v', 'libx264',
-            '-preset', 'fast',
-            '-crf', '18',
-            '-an',  # No audio (consistent with merge pipeline)
-            output_path
-        ]
+        if start_time == 0:
+            # Cutting only the end keeps the opening keyframe, so the video can be remuxed as-is
+            cmd = [
+                'ffmpeg', '-y',
+                '-i', input_path,
+                '-t', str(end_time),
+                '-c:v', 'copy',
+                '-an',  # No audio (consistent with merge pipeline)
+                '-movflags', '+faststart',
+                output_path
+            ]
+        else:
+            # FFmpeg trim command with accurate seeking (-ss after -i)
+            cmd = [
+                'ffmpeg', '-y',
+                '-i', input_path,
+                '-ss', str(start_time),
+                '-to', str(end_time),
+                *FFmpegService._video_codec_args(Config.LIBX264_CRF),
+                '-an',  # No audio (consistent with merge pipeline)
+                output_path
+            ]
 
         logger.info(f"Trimming video: {original_duration:.2f}s → {target_duration:.2f}s (mode={trim_mode}, start={start_time:.2f}s, end={end_time:.2f}s)")
 
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        _, stderr = await process.communicate()
+        try:
+            returncode, _, stderr = await FFmpegService.run_render_async(cmd, timeout=120)
+        except asyncio.TimeoutError:
+            raise RuntimeError("FFmpeg trim timed out (max 2 minutes)")
 
-        if process.returncode != 0:
+        if returncode != 0:
             raise RuntimeError(f"FFmpeg trim failed: {stderr.decode()}")
 
         logger.info(f"Successfully trimmed video to {target_duration}s")
         return {"trimmed": True, "duration": target_duration, "original_duration": original_duration}
 
+    @staticmethod
+    def _trim_window(
+        original_duration: float,
+        target_duration: float,
+        trim_mode: str = "both"
+    ) -> Tuple[float, float]:
+        """
+        Calculate the (start_time, end_time) that cuts a video down to target_duration
+
+        Args:
+            original_duration: Current duration in seconds
+            target_duration: Desired duration in seconds (must be shorter)
+            trim_mode: 'start' (cut from beginning), 'end' (cut from end), 'both' (split equally)
+        """
+        trim_total = original_duration - target_duration
+
+        if trim_mode == "start":
+            return trim_total, original_duration
+        if trim_mode == "end":
+            return 0, target_duration
+        # "both"
+        return trim_total / 2, original_duration - (trim_total / 2)
+
     @staticmethod
     def merge_videos(
         input_paths: List[str],
         output_path: str
     ) -> Dict[str, Any]:
         """
-        Merge multiple video files into a single video using FFmpeg concat filter
+        Merge multiple video files into a single video.
+
+        Inputs with identical H.264 stream parameters are joined with the concat
+        demuxer and stream copy; anything else goes through the concat filter
+        with fps/format normalization and a re-encode.
 
         Args:
             input_paths: List of paths to video files to merge
@@ -584,88 +1215,446 @@ class FFmpegService:
 
             logger.info(f"Merging {len(input_paths)} videos into {output_path}")
 
-            # Normalize fps and pixel format before concat to prevent timestamp issues
-            # Different frame rates between clips cause corrupted playback
-            normalize_filters = []
-            normalized_inputs = []
-            for i in range(len(input_paths)):
-                normalize_filters.append(f"[{i}:v]fps=30,format=yuv420p[v{i}]")
-                normalized_inputs.append(f"[v{i}]")
+            # Fast path: identical H.264 inputs can be joined without re-encoding
+            media_infos = FFmpegService.get_media_info_batch(input_paths)
+            progress = None
+            if FFmpegService._can_concat_copy(media_infos):
+                progress = FFmpegService._concat_copy(input_paths, output_path)
+
+            if progress is None:
+                cmd = FFmpegService._build_concat_filter_command(input_paths, output_path)
+
+                logger.info("Running FFmpeg merge command")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("FFmpeg command: %s", " ".join(cmd))
+
+                # Execute FFmpeg
+                returncode, stderr, progress = FFmpegService._run_ffmpeg(cmd, timeout=Config.MERGE_TIMEOUT)  # Configurable timeout for merging
+
+                if returncode != 0:
+                    logger.error(f"FFmpeg merge error: {stderr}")
+                    raise Exception(f"FFmpeg merge failed: {stderr}")
+
+            # Verify output file was created
+            try:
+                output_size = os.stat(output_path).st_size
+            except FileNotFoundError:
+                raise Exception("Merged output file was not created")
+
+            # Get output video duration from FFmpeg's final progress report,
+            # only probing the output if it wasn't reported
+            duration = FFmpegService._progress_duration(progress)
+            if duration is None:
+                media_info = FFmpegService.get_media_info(output_path)
+                duration = FFmpegService._extract_stream_summary(media_info)['duration']
 
-            concat_filter = ";".join(normalize_filters) + ";" + "".join(normalized_inputs) + f"concat=n={len(input_paths)}:v=1:a=0[v]"
-            map_args = ['-map', '[v]']
-            logger.info("Using video-only concat with fps/format normalization")
+            logger.info(f"Successfully merged {len(input_paths)} videos: {output_path} ({output_size} bytes, {duration}s)")
 
-            # Build FFmpeg command
-            cmd = ['ffmpeg', '-y']
+            return {
+                "success": True,
+                "output_path": output_path,
+                "output_size": output_size,
+                "duration": duration,
+                "clips_merged": len(input_paths)
+            }
+
+        except subprocess.TimeoutExpired:
+            timeout_mins = Config.MERGE_TIMEOUT / 60
+            raise Exception(f"FFmpeg merge timed out (max {timeout_mins:.0f} minutes)")
+        except Exception as e:
+            logger.error(f"Error merging videos: {str(e)}")
+            raise
+
+    @staticmethod
+    def _build_concat_filter_command(input_paths: List[str], output_path: str) -> List[str]:
+        """Build the re-encoding concat filter merge command"""
+        # Normalize fps and pixel format before concat to prevent timestamp issues
+        # Different frame rates between clips cause corrupted playback
+        normalize_filters = []
+        normalized_inputs = []
+        for i in range(len(input_paths)):
+            normalize_filters.append(f"[{i}:v]{CONCAT_NORMALIZE_FILTER}[v{i}]")
+            normalized_inputs.append(f"[v{i}]")
+
+        concat_filter = ";".join(normalize_filters) + ";" + "".join(normalized_inputs) + f"concat=n={len(input_paths)}:v=1:a=0[v]"
+        map_args = ['-map', '[v]']
+        logger.info("Using video-only concat with fps/format normalization")
+
+        # Build FFmpeg command
+        cmd = ['ffmpeg', '-y', *FFmpegService._filter_thread_args()]
+
+        # Add all input files
+        for input_path in input_paths:
+            cmd.extend(['-i', input_path])
+
+        # Add filter_complex and output settings
+        cmd.extend([
+            '-filter_complex', concat_filter,
+            *map_args,
+            *FFmpegService._video_codec_args(Config.LIBX264_CRF),  # H.264 video codec
+        ])
+
+        cmd.extend([
+            '-movflags', '+faststart',  # Enable streaming
+            output_path
+        ])
+
+        return cmd
+
+    @staticmethod
+    def _concat_copy_signature(media_info: Dict[str, Any]) -> Optional[Tuple]:
+        """Video stream parameters that must match across inputs for stream-copy concat"""
+        for stream in media_info.get('streams', []):
+            if stream.get('codec_type') == 'video':
+                return tuple(stream.get(key) for key in (
+                    'codec_name', 'profile', 'width', 'height',
+                    'pix_fmt', 'r_frame_rate', 'time_base'
+                ))
+        return None
+
+    @staticmethod
+    def _can_concat_copy(media_infos: List[Dict[str, Any]]) -> bool:
+        """Check whether all inputs are H.264/yuv420p with identical stream parameters"""
+        signatures = {FFmpegService._concat_copy_signature(info) for info in media_infos}
+        if len(signatures) != 1:
+            return False
+        signature = signatures.pop()
+        return signature is not None and signature[0] == 'h264' and signature[4] == 'yuv420p'
+
+    @staticmethod
+    def _concat_copy(input_paths: List[str], output_path: str) -> Optional[Dict[str, str]]:
+        """
+        Merge inputs with the concat demuxer and stream copy (no decode/encode).
+
+        Returns:
+            FFmpeg's final progress report on success, None if the caller should
+            fall back to re-encoding
+        """
+        list_file = tempfile.NamedTemporaryFile(
+            delete=False,
+            suffix=".txt",
+            mode="w",
+            encoding="utf-8",
+            dir=Config.TEMP_DIR
+        )
+        try:
+            for path in input_paths:
+                escaped = os.path.abspath(path).replace("'", "'\\''")
+                list_file.write(f"file '{escaped}'\n")
+            list_file.close()
+
+            cmd = [
+                'ffmpeg', '-y',
+                '-f', 'concat',
+                '-safe', '0',
+                '-i', list_file.name,
+                '-map', '0:v',
+                '-c', 'copy',
+                '-an',  # Video-only, consistent with the concat filter path
+                '-movflags', '+faststart',
+                output_path
+            ]
 
-            # Add all input files
-            for input_path in input_paths:
+            logger.info("Running FFmpeg concat copy command")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("FFmpeg command: %s", " ".join(cmd))
+
+            returncode, stderr, progress = FFmpegService._run_ffmpeg(cmd, timeout=Config.MERGE_TIMEOUT)
+
+            if returncode != 0:
+                logger.warning(f"Concat copy failed, falling back to re-encode: {stderr}")
+                return None
+
+            logger.info("Merged with stream copy (inputs share codec parameters)")
+            return progress
+
+        finally:
+            list_file.close()
+            try:
+                os.remove(list_file.name)
+            except OSError as cleanup_err:
+                logger.warning(f"Failed to clean up concat list {list_file.name}: {cleanup_err}")
+
+    @staticmethod
+    def overlay_and_merge(
+        jobs: List[Dict[str, Any]],
+        output_path: str
+    ) -> Dict[str, Any]:
+        """
+        Overlay text on several clips and concatenate them in a single FFmpeg pass.
+
+        Each input gets its own (scale/pad +) drawtext chain, normalized like the
+        concat filter path, and all chains feed one concat node. No intermediate
+        files are written and every frame is encoded once.
+
+        Args:
+            jobs: One dict per clip, in order, with add_text_overlay keyword
+                  arguments ('input_path', 'text', 'template_name', 'overrides',
+                  'apply_fade_out', 'video_width', 'scale_to', 'trim');
+                  'output_path' is ignored
+            output_path: Path for the merged output file
+
+        Returns:
+            Dict with success status and metadata (same shape as merge_videos)
+
+        Raises:
+            Exception: If overlay preparation or the merge fails
+        """
+        if len(jobs) < 2:
+            raise ValueError("At least 2 videos are required for merging")
+
+        text_file_paths = []
+        try:
+            cmd = ['ffmpeg', '-y', *FFmpegService._filter_thread_args()]
+            chains = []
+            for i, job in enumerate(jobs):
+                job = {key: value for key, value in job.items() if key != 'output_path'}
+                input_path = job.pop('input_path')
+                if not os.path.exists(input_path):
+                    raise FileNotFoundError(f"Input file not found: {input_path}")
+
+                job['normalize_for_concat'] = True
+                filter_str, text_file_path = FFmpegService._prepare_overlay_filter(input_path, **job)
+                text_file_paths.append(text_file_path)
+
+                trim = job.get('trim')
+                if trim:
+                    # Input seeking per clip, same as the single-clip overlay path
+                    cmd.extend(['-ss', str(trim[0]), '-t', str(trim[1] - trim[0])])
                 cmd.extend(['-i', input_path])
+                chains.append(f"[{i}:v]{filter_str}[v{i}]")
 
-            # Add filter_complex and output settings
-            cmd.extend([
-                '-filter_complex', concat_filter,
-                *map_args,
-                '-c:v', 'libx264',  # H.264 video codec
-                '-preset', 'slow',  # Encoding speed/quality tradeoff (slow = better quality)
-                '-crf', '18',  # Constant Rate Factor (18 = high quality, lower = better)
-            ])
+            concat_inputs = "".join(f"[v{i}]" for i in range(len(jobs)))
+            filter_complex = ";".join(chains) + f";{concat_inputs}concat=n={len(jobs)}:v=1:a=0[v]"
 
             cmd.extend([
-                '-movflags', '+faststart',  # Enable streaming
+                '-filter_complex', filter_complex,
+                '-map', '[v]',
+                *FFmpegService._video_codec_args(Config.LIBX264_CRF),
+                '-movflags', '+faststart',
                 output_path
             ])
 
-            logger.info(f"Running FFmpeg merge command: {' '.join(cmd)}")
+            logger.info(f"Running FFmpeg overlay+merge command for {len(jobs)} clips")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("FFmpeg command: %s", " ".join(cmd))
 
-            # Execute FFmpeg
-            process = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=Config.MERGE_TIMEOUT  # Configurable timeout for merging
-            )
+            returncode, stderr, progress = FFmpegService._run_ffmpeg(cmd, timeout=Config.MERGE_TIMEOUT)
 
-            if process.returncode != 0:
-                logger.error(f"FFmpeg merge error: {process.stderr}")
-                raise Exception(f"FFmpeg merge failed: {process.stderr}")
+            if returncode != 0:
+                logger.error(f"FFmpeg overlay+merge error: {stderr}")
+                raise Exception(f"FFmpeg merge failed: {stderr}")
 
-            # Verify output file was created
-            if not os.path.exists(output_path):
+            try:
+                output_size = os.stat(output_path).st_size
+            except FileNotFoundError:
                 raise Exception("Merged output file was not created")
 
-            output_size = os.path.getsize(output_path)
-
-            # Get output video duration
-            media_info = FFmpegService.get_media_info(output_path)
-            duration = None
-            if 'format' in media_info and 'duration' in media_info['format']:
-                duration = float(media_info['format']['duration'])
+            duration = FFmpegService._progress_duration(progress)
+            if duration is None:
+                media_info = FFmpegService.get_media_info(output_path)
+                duration = FFmpegService._extract_stream_summary(media_info)['duration']
 
-            logger.info(f"Successfully merged {len(input_paths)} videos: {output_path} ({output_size} bytes, {duration}s)")
+            logger.info(f"Successfully overlaid and merged {len(jobs)} videos: {output_path} ({output_size} bytes, {duration}s)")
 
             return {
                 "success": True,
                 "output_path": output_path,
                 "output_size": output_size,
                 "duration": duration,
-                "clips_merged": len(input_paths)
+                "clips_merged": len(jobs)
             }
 
         except subprocess.TimeoutExpired:
             timeout_mins = Config.MERGE_TIMEOUT / 60
             raise Exception(f"FFmpeg merge timed out (max {timeout_mins:.0f} minutes)")
         except Exception as e:
-            logger.error(f"Error merging videos: {str(e)}")
+            logger.error(f"Error overlaying and merging videos: {str(e)}")
             raise
+        finally:
+            for text_file_path in text_file_paths:
+                try:
+                    os.remove(text_file_path)
+                except FileNotFoundError:
+                    pass
+                except Exception as cleanup_err:
+                    logger.warning(f"Failed to clean up temp text file {text_file_path}: {cleanup_err}")
+
+    @staticmethod
+    def merge_videos_streaming(
+        producers: List[Callable[[BinaryIO], None]],
+        output_path: str
+    ) -> Dict[str, Any]:
+        """
+        Merge videos generated in memory without staging them on disk.
+
+        Each producer runs on its own thread and writes one complete video to
+        the binary stream it is given. The format must be readable from a pipe
+        (MPEG-TS, or MP4 with the moov atom first). Streams reach FFmpeg through
+        named pipes and are joined with the concat filter.
+
+        Args:
+            producers: Callables that each write one input video
+            output_path: Path for the merged output file
+
+        Returns:
+            Dict with success status and metadata
+
+        Raises:
+            Exception: If merge fails, a producer fails or input validation fails
+        """
+        if len(producers) < 2:
+            raise ValueError("At least 2 videos are required for merging")
+
+        fifo_dir = tempfile.mkdtemp(prefix="merge_", dir=Config.TEMP_DIR)
+        fifo_paths = [os.path.join(fifo_dir, f"input{i}") for i in range(len(producers))]
+        errors: List[Optional[Exception]] = [None] * len(producers)
+        opened = [threading.Event() for _ in producers]
+        threads = []
+
+        def feed(index: int) -> None:
+            try:
+                with open(fifo_paths[index], 'wb') as pipe:
+                    opened[index].set()
+                    FFmpegService._grow_pipe_buffer(pipe.fileno())
+                    producers[index](pipe)
+            except Exception as e:
+                errors[index] = e
+
+        try:
+            for path in fifo_paths:
+                os.mkfifo(path)
+
+            threads = [
+                threading.Thread(target=feed, args=(i,), name=f"merge-producer-{i}", daemon=True)
+                for i in range(len(producers))
+            ]
+            for thread in threads:
+                thread.start()
+
+            logger.info(f"Merging {len(producers)} streamed videos into {output_path}")
+            cmd = FFmpegService._build_concat_filter_command(fifo_paths, output_path)
+
+            logger.info("Running FFmpeg streaming merge command")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("FFmpeg command: %s", " ".join(cmd))
+
+            # Producers may legitimately go quiet (FFmpeg waits on the pipe), so only the overall timeout applies
+            returncode, stderr, progress = FFmpegService._run_ffmpeg(cmd, timeout=Config.MERGE_TIMEOUT, stall_timeout=0)
+
+        except subprocess.TimeoutExpired:
+            timeout_mins = Config.MERGE_TIMEOUT / 60
+            raise Exception(f"FFmpeg merge timed out (max {timeout_mins:.0f} minutes)")
+
+        finally:
+            # Release producers still blocked opening or writing a pipe FFmpeg never drained:
+            # a temporary reader lets open() return, closing it makes writes fail with EPIPE
+            for index, thread in enumerate(threads):
+                if thread.is_alive():
+                    try:
+                        fd = os.open(fifo_paths[index], os.O_RDONLY | os.O_NONBLOCK)
+                    except OSError:
+                        continue
+                    opened[index].wait(timeout=5)
+                    os.close(fd)
+                thread.join(timeout=5)
+            shutil.rmtree(fifo_dir, ignore_errors=True)
+
+        if returncode != 0:
+            logger.error(f"FFmpeg streaming merge error: {stderr}")
+            raise Exception(f"FFmpeg merge failed: {stderr}")
+
+        for index, error in enumerate(errors):
+            if error is not None:
+                raise Exception(f"Producer for clip {index} failed: {error}") from error
+
+        try:
+            output_size = os.stat(output_path).st_size
+        except FileNotFoundError:
+            raise Exception("Merged output file was not created")
+
+        duration = FFmpegService._progress_duration(progress)
+        if duration is None:
+            media_info = FFmpegService.get_media_info(output_path)
+            duration = FFmpegService._extract_stream_summary(media_info)['duration']
+
+        logger.info(f"Successfully merged {len(producers)} streamed videos: {output_path} ({output_size} bytes, {duration}s)")
+
+        return {
+            "success": True,
+            "output_path": output_path,
+            "output_size": output_size,
+            "duration": duration,
+            "clips_merged": len(producers)
+        }
+
+    @staticmethod
+    def stream_text_overlay(pipe: BinaryIO, **job) -> None:
+        """
+        Overlay text on one video and write the result to a pipe as MPEG-TS
+
+        Producer for merge_videos_streaming: the overlaid clip goes straight to
+        the merge instead of through a temp file.
+
+        Args:
+            pipe: Open binary stream to write the video to
+            **job: add_text_overlay keyword arguments; 'output_path' is ignored
+
+        Raises:
+            Exception: If the overlay encode fails or times out
+        """
+        job = {key: value for key, value in job.items() if key != 'output_path'}
+        input_path = job.pop('input_path')
+        if not os.path.exists(input_path):
+            raise FileNotFoundError(f"Input file not found: {input_path}")
+
+        filter_str, text_file_path = FFmpegService._prepare_overlay_filter(input_path, **job)
+        try:
+            fd = pipe.fileno()
+            cmd = FFmpegService._build_ffmpeg_command(
+                input_path, f"pipe:{fd}", filter_str, False, trim=job.get('trim'), output_format='mpegts'
+            )
+
+            logger.info(f"Running FFmpeg overlay command streaming {input_path}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("FFmpeg command: %s", " ".join(cmd))
+
+            # Blocks on the pipe while the merge reads other clips, so only the overall timeout applies
+            returncode, stderr, _ = FFmpegService._run_ffmpeg(
+                cmd, timeout=Config.MERGE_TIMEOUT, stall_timeout=0, pass_fds=(fd,)
+            )
+            if returncode != 0:
+                logger.error(f"FFmpeg error: {stderr}")
+                raise Exception(f"FFmpeg processing failed: {stderr}")
+
+        except subprocess.TimeoutExpired:
+            timeout_mins = Config.MERGE_TIMEOUT / 60
+            raise Exception(f"FFmpeg processing timed out (max {timeout_mins:.0f} minutes)")
+
+        finally:
+            try:
+                os.remove(text_file_path)
+            except FileNotFoundError:
+                pass
+            except Exception as cleanup_err:
+                logger.warning(f"Failed to clean up temp text file {text_file_path}: {cleanup_err}")
+
+    @staticmethod
+    def _grow_pipe_buffer(fd: int) -> None:
+        """Enlarge a pipe's kernel buffer (Linux only, best effort)"""
+        try:
+            import fcntl
+            fcntl.fcntl(fd, fcntl.F_SETPIPE_SZ, Config.MERGE_PIPE_BUFFER_SIZE)
+        except (ImportError, AttributeError, OSError) as e:
+            logger.debug(f"Could not resize pipe buffer: {e}")
 
     @staticmethod
     def scale_video(
         input_path: str,
         output_path: str,
         target_width: int,
-        target_height: int
+        target_height: int,
+        media_info: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Scale a video to target resolution with aspect ratio preservation and padding
@@ -675,6 +1664,7 @@ class FFmpegService:
             output_path: Path to save scaled video
             target_width: Target width in pixels
             target_height: Target height in pixels
+            media_info: Pre-fetched ffprobe output for input_path (probed if omitted)
 
         Returns:
             Dictionary with success status and output info
@@ -689,15 +1679,16 @@ class FFmpegService:
             logger.info(f"Scaling video {input_path} to {target_width}x{target_height}")
 
             # Get current video dimensions
-            media_info = FFmpegService.get_media_info(input_path)
-            current_width = FFmpegService._get_video_width(media_info)
-            current_height = FFmpegService._get_video_height(media_info)
+            if media_info is None:
+                media_info = FFmpegService.get_media_info(input_path)
+            summary = FFmpegService._extract_stream_summary(media_info)
+            current_width = summary['video_width']
+            current_height = summary['video_height']
 
             if current_width == target_width and current_height == target_height:
                 # Already correct size - just copy
                 logger.info(f"Video already at target resolution, copying: {input_path}")
-                import shutil
-                shutil.copy2(input_path, output_path)
+                FFmpegService._fast_clone(input_path, output_path)
                 return {
                     "success": True,
                     "output_path": output_path,
@@ -705,43 +1696,34 @@ class FFmpegService:
                 }
 
             # Build FFmpeg command with scale + pad filters
-            # This maintains aspect ratio and centers video with black bars
-            filter_str = (
-                f"scale={target_width}:{target_height}:force_original_aspect_ratio=decrease,"
-                f"pad={target_width}:{target_height}:(ow-iw)/2:(oh-ih)/2"
-            )
+            filter_str = FFmpegService._scale_pad_filter(target_width, target_height)
 
             cmd = [
                 'ffmpeg', '-y',
                 '-i', input_path,
                 '-vf', filter_str,
-                '-c:v', 'libx264',  # Re-encode video
-                '-preset', 'medium',
-                '-crf', '23',  # Quality setting
+                *FFmpegService._video_codec_args('23'),  # Re-encode video
                 '-c:a', 'copy',  # Copy audio without re-encoding
                 '-movflags', '+faststart',
                 output_path
             ]
 
-            logger.info(f"Running FFmpeg scale command: {' '.join(cmd)}")
+            logger.info("Running FFmpeg scale command")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("FFmpeg command: %s", " ".join(cmd))
 
             # Execute FFmpeg
-            process = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=120  # 2 minute timeout
-            )
+            returncode, stderr, _ = FFmpegService._run_ffmpeg(cmd, timeout=120)  # 2 minute timeout
 
-            if process.returncode != 0:
-                logger.error(f"FFmpeg scale error: {process.stderr}")
-                raise Exception(f"FFmpeg scale failed: {process.stderr}")
+            if returncode != 0:
+                logger.error(f"FFmpeg scale error: {stderr}")
+                raise Exception(f"FFmpeg scale failed: {stderr}")
 
             # Verify output file was created
-            if not os.path.exists(output_path):
+            try:
+                output_size = os.stat(output_path).st_size
+            except FileNotFoundError:
                 raise Exception("Scaled output file was not created")
-
-            output_size = os.path.getsize(output_path)
             logger.info(f"Successfully scaled video: {output_path} ({output_size} bytes)")
 
             return {
@@ -756,3 +1738,37 @@ class FFmpegService:
         except Exception as e:
             logger.error(f"Error scaling video: {str(e)}")
             raise
+
+    @staticmethod
+    def _fast_clone(src: str, dst: str) -> None:
+        """Copy src to dst as cheaply as the filesystem allows (hard link, reflink, then full copy)"""
+        # Replace an existing dst like shutil.copy2 would, without writing through a link to src
+        try:
+            os.remove(dst)
+        except FileNotFoundError:
+            pass
+
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+
+        try:
+            import fcntl
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return
+        except (ImportError, OSError):
+            pass
+
+        shutil.copy2(src, dst)
+
+    @staticmethod
+    def _scale_pad_filter(target_width: int, target_height: int) -> str:
+        """Scale to fit the target, keeping aspect ratio, and center with black bars"""
+        return (
+            f"scale={target_width}:{target_height}:force_original_aspect_ratio=decrease,"
+            f"pad={target_width}:{target_height}:(ow-iw)/2:(oh-ih)/2"
+        )
@@ -2,7 +2,10 @@
 Service for merging multiple video clips with text overlays
 """
 import asyncio
+import functools
+import json
 import os
+import time
 import uuid
 import logging
 from typing import List, Dict, Tuple, Optional
@@ -13,6 +16,9 @@ from models.schemas import TextOverrideOptions
 
 logger = logging.getLogger(__name__)
 
+# Pending background cleanups (strong references so tasks aren't garbage collected mid-run)
+_CLEANUP_TASKS = set()
+
 
 class MergeService:
     """Handles downloading, processing, and merging multiple video clips"""
@@ -50,27 +56,41 @@ class MergeService:
             logger.error(f"Failed to download clips: {str(e)}")
             raise Exception(f"Clip download failed: {str(e)}")
 
-    def scale_clips_to_target(
+    async def prevalidate_urls(self, clip_urls: List[str]) -> None:
+        """
+        Check every clip URL with a concurrent HEAD request before downloading any
+
+        Raises:
+            Exception: If any clip is known to be missing, too large or of the wrong type
+        """
+        results = await asyncio.gather(
+            *(self.download_service.prevalidate_url(url) for url in clip_urls),
+            return_exceptions=True
+        )
+        for i, result in enumerate(results):
+            if isinstance(result, BaseException):
+                raise Exception(f"Clip {i+1} download failed: {str(result)}")
+
+    def get_target_resolution(
         self,
         downloaded_clips: List[Tuple[str, str]]
-    ) -> Tuple[List[str], int, int]:
+    ) -> Tuple[int, int, List[Dict]]:
         """
-        Scale all clips to match the first clip's resolution
+        Determine the merge resolution from the first clip
 
         Args:
             downloaded_clips: List of tuples (file_path, content_type)
 
         Returns:
-            Tuple of (scaled_clip_paths, target_width, target_height)
+            Tuple of (target_width, target_height, media_infos) where media_infos
+            holds the ffprobe output of every clip, in order
 
         Raises:
-            Exception: If scaling fails
+            Exception: If the first clip can't be probed
         """
         if not downloaded_clips:
             raise ValueError("No clips to scale")
 
-        scaled_paths = []
-
         try:
             # Get target resolution from first clip
             first_clip_path = downloaded_clips[0][0]
@@ -79,7 +99,10 @@ class MergeService:
             if not os.path.exists(first_clip_path):
                 raise FileNotFoundError(f"First clip file not found: {first_clip_path}")
 
-            media_info = self.ffmpeg_service.get_media_info(first_clip_path)
+            # Probe every clip up front (concurrently) so overlays don't re-probe serially
+            clip_paths = [clip_path for clip_path, _ in downloaded_clips]
+            media_infos = self.ffmpeg_service.get_media_info_batch(clip_paths)
+            media_info = media_infos[0]
 
             # Check if probe succeeded
             if not media_info or 'streams' not in media_info:
@@ -88,8 +111,9 @@ class MergeService:
                     f"Path: {first_clip_path}"
                 )
 
-            target_width = self.ffmpeg_service._get_video_width(media_info)
-            target_height = self.ffmpeg_service._get_video_height(media_info)
+            summary = self.ffmpeg_service._extract_stream_summary(media_info)
+            target_width = summary['video_width']
+            target_height = summary['video_height']
 
             if target_width is None or target_height is None:
                 raise ValueError(
@@ -99,50 +123,106 @@ class MergeService:
                 )
 
             logger.info(f"Target resolution from first clip: {target_width}x{target_height}")
+            return target_width, target_height, media_infos
 
-            # Scale each clip to target resolution
-            for i, (clip_path, content_type) in enumerate(downloaded_clips):
-                logger.info(f"Scaling clip {i+1}/{len(downloaded_clips)} to {target_width}x{target_height}")
-
-                # Generate output path for scaled clip
-                output_filename = f"scaled_{uuid.uuid4()}.mp4"
-                output_path = os.path.join(Config.TEMP_DIR, output_filename)
-
-                # Scale video (or copy if already correct size)
-                result = self.ffmpeg_service.scale_video(
-                    input_path=clip_path,
-                    output_path=output_path,
-                    target_width=target_width,
-                    target_height=target_height
-                )
+        except Exception as e:
+            logger.error(f"Could not determine target resolution: {str(e)}")
+            raise Exception(f"Clip scaling failed: {str(e)}")
 
-                if not result.get('success'):
-                    raise Exception(f"Failed to scale clip {i+1}")
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_overrides(overrides_json: str) -> TextOverrideOptions:
+        """
+        Validate clip overrides once per distinct value
 
-                scaled_paths.append(output_path)
-                logger.info(f"Clip {i+1}: {'Scaled' if result.get('scaled') else 'Copied'} to {output_path}")
+        Clips usually share the same overrides, so the validated (read-only)
+        instance is reused instead of re-running pydantic validation per clip.
+        """
+        return TextOverrideOptions(**json.loads(overrides_json))
 
-            logger.info(f"Successfully scaled {len(scaled_paths)} clips to {target_width}x{target_height}")
-            return scaled_paths, target_width, target_height
+    def build_overlay_jobs(
+        self,
+        clip_configs: List[Dict],
+        clip_paths: List[str],
+        target_width: Optional[int] = None,
+        target_height: Optional[int] = None,
+        media_infos: Optional[List[Dict]] = None,
+        first_clip_trim: Optional[Tuple[float, float]] = None
+    ) -> List[Dict]:
+        """
+        Build the add_text_overlay arguments for each clip
 
-        except Exception as e:
-            # Cleanup any partially scaled files
-            for path in scaled_paths:
-                self.cleanup_file(path)
-            logger.error(f"Scaling failed: {str(e)}")
-            raise Exception(f"Clip scaling failed: {str(e)}")
+        Args:
+            clip_configs: List of clip configurations with text/template/overrides
+            clip_paths: List of paths to video files
+            target_width: Width all clips are scaled to (avoids re-probing each clip)
+            target_height: Height all clips are scaled to
+            media_infos: ffprobe output per clip, used to skip scaling clips already at target size
+            first_clip_trim: Optional (start_time, end_time) to cut the first clip to
 
-    def apply_overlays_to_clips(
+        Returns:
+            List of keyword-argument dicts for add_text_overlay, one per clip
+        """
+        overlay_jobs = []
+
+        for i, (clip_path, config) in enumerate(zip(clip_paths, clip_configs)):
+            logger.info(f"Queueing overlay for clip {i+1}/{len(clip_configs)}: {config.get('text')}")
+
+            # Generate output path for overlayed clip
+            output_filename = f"overlayed_{uuid.uuid4()}.mp4"
+            output_path = os.path.join(Config.TEMP_DIR, output_filename)
+
+            # Parse overrides if provided
+            overrides = None
+            if config.get('overrides'):
+                try:
+                    overrides = self._parse_overrides(json.dumps(config['overrides'], sort_keys=True))
+                except Exception as e:
+                    logger.warning(f"Failed to parse overrides for clip {i+1}: {e}")
+
+            # Detect if this is the last clip - hide text in final seconds only for last clip
+            is_last_clip = (i == len(clip_configs) - 1)
+            if is_last_clip:
+                logger.info(f"Last clip detected - text will disappear in final 2.5 seconds (clip {i+1})")
+
+            # Scale/pad only clips that differ from the target resolution
+            scale_to = None
+            if target_width and target_height and media_infos:
+                summary = self.ffmpeg_service._extract_stream_summary(media_infos[i])
+                if (summary['video_width'], summary['video_height']) != (target_width, target_height):
+                    scale_to = (target_width, target_height)
+                    logger.info(f"Clip {i+1} will be scaled to {target_width}x{target_height} with its overlay")
+
+            overlay_jobs.append({
+                'input_path': clip_path,
+                'output_path': output_path,
+                'text': config['text'],
+                'template_name': config.get('template', 'default'),
+                'overrides': overrides,
+                'apply_fade_out': is_last_clip,
+                'video_width': target_width,
+                'scale_to': scale_to,
+                'trim': first_clip_trim if i == 0 else None,
+                # Same fps/pix_fmt for every clip so the merge can stream-copy
+                'normalize_for_concat': True
+            })
+
+        return overlay_jobs
+
+    async def apply_overlays_to_clips(
         self,
         clip_configs: List[Dict],
-        scaled_clip_paths: List[str]
+        clip_paths: List[str],
+        target_width: Optional[int] = None,
+        target_height: Optional[int] = None,
+        media_infos: Optional[List[Dict]] = None,
+        first_clip_trim: Optional[Tuple[float, float]] = None
     ) -> List[str]:
         """
-        Apply text overlays to each scaled clip
+        Apply text overlays to each clip, scaling it to the target resolution in the same pass
 
         Args:
-            clip_configs: List of clip configurations with text/template/overrides
-            scaled_clip_paths: List of paths to scaled video files
+            Same as build_overlay_jobs
 
         Returns:
             List of paths to overlayed clip files
@@ -150,45 +230,26 @@ class MergeService:
         Raises:
             Exception: If overlay processing fails
         """
-        overlayed_paths = []
+        overlay_jobs = self.build_overlay_jobs(
+            clip_configs, clip_paths, target_width, target_height, media_infos, first_clip_trim
+        )
+        overlayed_paths = [job['output_path'] for job in overlay_jobs]
 
         try:
-            for i, (clip_path, config) in enumerate(zip(scaled_clip_paths, clip_configs)):
-                logger.info(f"Applying overlay to clip {i+1}/{len(clip_configs)}: {config.get('text')}")
-
-                # Generate output path for overlayed clip
-                output_filename = f"overlayed_{uuid.uuid4()}.mp4"
-                output_path = os.path.join(Config.TEMP_DIR, output_filename)
-
-                # Parse overrides if provided
-                overrides = None
-                if config.get('overrides'):
-                    try:
-                        overrides = TextOverrideOptions(**config['overrides'])
-                    except Exception as e:
-                        logger.warning(f"Failed to parse overrides for clip {i+1}: {e}")
-
-                # Detect if this is the last clip - hide text in final seconds only for last clip
-                is_last_clip = (i == len(clip_configs) - 1)
-                if is_last_clip:
-                    logger.info(f"Last clip detected - text will disappear in final 2.5 seconds (clip {i+1})")
-
-                # Apply text overlay using FFmpeg service
-                result = self.ffmpeg_service.add_text_overlay(
-                    input_path=clip_path,
-                    output_path=output_path,
-                    text=config['text'],
-                    template_name=config.get('template', 'default'),
-                    overrides=overrides,
-                    apply_fade_out=is_last_clip
-                )
+            # Clips are independent, so overlay them concurrently on the FFmpeg worker pool.
+            # Every job is allowed to finish before failing so all outputs can be cleaned up.
+            results = await asyncio.gather(
+                *(self.ffmpeg_service.add_text_overlay_async(**job) for job in overlay_jobs),
+                return_exceptions=True
+            )
 
+            for i, result in enumerate(results):
+                if isinstance(result, BaseException):
+                    raise result
                 if not result.get('success'):
                     raise Exception(f"Failed to apply overlay to clip {i+1}")
 
-                overlayed_paths.append(output_path)
-                logger.info(f"Successfully overlayed clip {i+1}: {output_path}")
-
+            logger.info(f"Successfully overlayed {len(overlayed_paths)} clips")
             return overlayed_paths
 
         except Exception as e:
@@ -197,7 +258,7 @@ class MergeService:
                 self.cleanup_file(path)
             raise Exception(f"Overlay processing failed: {str(e)}")
 
-    def merge_clips(self, overlayed_paths: List[str], output_path: str) -> Dict:
+    async def merge_clips(self, overlayed_paths: List[str], output_path: str) -> Dict:
         """
         Merge multiple overlayed clips into a single video
 
@@ -214,8 +275,8 @@ class MergeService:
         logger.info(f"Merging {len(overlayed_paths)} clips into {output_path}")
 
         try:
-            # Use FFmpeg service's merge_videos method
-            result = self.ffmpeg_service.merge_videos(
+            # Use FFmpeg service's merge_videos method (on the FFmpeg worker pool)
+            result = await self.ffmpeg_service.merge_videos_async(
                 input_paths=overlayed_paths,
                 output_path=output_path
             )
@@ -267,9 +328,10 @@ class MergeService:
     def cleanup_file(file_path: str) -> None:
         """Delete a temporary file"""
         try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                logger.debug(f"Cleaned up: {file_path}")
+            os.unlink(file_path)
+            logger.debug(f"Cleaned up: {file_path}")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.warning(f"Failed to cleanup {file_path}: {str(e)}")
 
@@ -279,6 +341,55 @@ class MergeService:
         for path in file_paths:
             MergeService.cleanup_file(path)
 
+    @staticmethod
+    def schedule_cleanup(file_paths: List[str]) -> None:
+        """Delete temporary files in the background so the caller doesn't wait on it"""
+        if not file_paths:
+            return
+        task = asyncio.create_task(asyncio.to_thread(MergeService.cleanup_files, list(file_paths)))
+        _CLEANUP_TASKS.add(task)
+        task.add_done_callback(_CLEANUP_TASKS.discard)
+
+    @staticmethod
+    async def wait_for_cleanups() -> None:
+        """Wait for pending background cleanups (call on application shutdown)"""
+        if _CLEANUP_TASKS:
+            await asyncio.gather(*_CLEANUP_TASKS, return_exceptions=True)
+
+    @staticmethod
+    def sweep_orphaned_files(max_age: float = 3600) -> int:
+        """
+        Delete overlayed clips left in TEMP_DIR by interrupted merges
+
+        Args:
+            max_age: Only files older than this many seconds are removed
+
+        Returns:
+            Number of files removed
+        """
+        cutoff = time.time() - max_age
+        removed = 0
+        try:
+            entries = list(os.scandir(Config.TEMP_DIR))
+        except FileNotFoundError:
+            return 0
+
+        for entry in entries:
+            if not (entry.name.startswith("overlayed_") and entry.name.endswith(".mp4")):
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    removed += 1
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Failed to cleanup {entry.path}: {str(e)}")
+
+        if removed:
+            logger.info(f"Removed {removed} orphaned overlayed clips from {Config.TEMP_DIR}")
+        return removed
+
     async def process_merge_request(
         self,
         clip_configs: List[Dict],
@@ -289,8 +400,11 @@ class MergeService:
         """
         Main entry point: Download, scale, overlay, and merge clips
 
-        New workflow: Download → Trim (optional) → Scale → Overlay → Merge
-        This ensures text overlays wrap correctly to target canvas dimensions
+        New workflow: Download → Trim (optional) + Scale + Overlay → Merge
+        This ensures text overlays wrap correctly to target canvas dimensions,
+        and trimming/scaling share the overlay's decode/encode instead of adding their own.
+        With MERGE_SINGLE_PASS the overlay and merge steps run as one FFmpeg pass.
+        With MERGE_STREAM_OVERLAYS the per-clip overlays feed the merge through pipes.
 
         Args:
             clip_configs: List of clip configurations
@@ -305,65 +419,116 @@ class MergeService:
             Exception: If any step fails
         """
         downloaded_paths = []
-        scaled_paths = []
         overlayed_paths = []
-        trimmed_path = None
 
         try:
             # Step 1: Validate request
             self.validate_merge_request(clip_configs)
 
-            # Step 2: Download all clips
+            # Step 2: Reject bad URLs up front, then download all clips
             clip_urls = [config['url'] for config in clip_configs]
+            await self.prevalidate_urls(clip_urls)
             downloaded_clips = await self.download_clips(clip_urls)
             downloaded_paths = [path for path, _ in downloaded_clips]
 
-            # Step 2.5: Trim first clip if requested
-            if first_clip_duration is not None and len(downloaded_clips) > 0:
-                first_clip_path, first_clip_type = downloaded_clips[0]
-                trimmed_path = first_clip_path.replace('.mp4', '_trimmed.mp4')
-                if not trimmed_path.endswith('.mp4'):
-                    trimmed_path = first_clip_path + '_trimmed.mp4'
-
-                trim_result = await self.ffmpeg_service.trim_video(
-                    input_path=first_clip_path,
-                    output_path=trimmed_path,
-                    target_duration=first_clip_duration,
-                    trim_mode=first_clip_trim_mode
-                )
+            # Step 3: Use the first clip's resolution as the target for all clips
+            target_width, target_height, media_infos = self.get_target_resolution(downloaded_clips)
 
-                if trim_result['trimmed']:
-                    # Replace first clip with trimmed version
-                    downloaded_clips[0] = (trimmed_path, first_clip_type)
-                    # Clean up original untrimmed file immediately
-                    self.cleanup_file(first_clip_path)
-                    # Update downloaded_paths to include trimmed file for later cleanup
-                    downloaded_paths[0] = trimmed_path
-                    logger.info(f"First clip trimmed: {trim_result['original_duration']:.2f}s → {first_clip_duration}s (mode={first_clip_trim_mode})")
-                else:
-                    # Trimming was skipped, remove unused trimmed_path
-                    trimmed_path = None
+            # Step 3.5: Work out the first clip's trim window (applied during its overlay pass)
+            first_clip_trim = None
+            if first_clip_duration is not None:
+                original_duration = self.ffmpeg_service._extract_stream_summary(media_infos[0])['duration']
+                if original_duration is None:
+                    raise ValueError("Could not determine first clip duration for trimming")
 
-            # Step 3: Scale all clips to match first clip's resolution
-            scaled_paths, target_width, target_height = self.scale_clips_to_target(downloaded_clips)
+                if first_clip_duration >= original_duration:
+                    logger.info(f"Target duration {first_clip_duration}s >= original {original_duration}s, skipping trim")
+                else:
+                    first_clip_trim = self.ffmpeg_service._trim_window(
+                        original_duration, first_clip_duration, first_clip_trim_mode
+                    )
+                    logger.info(f"First clip will be trimmed: {original_duration:.2f}s → {first_clip_duration}s (mode={first_clip_trim_mode})")
+
+            clip_paths = [path for path, _ in downloaded_clips]
+
+            if Config.MERGE_SINGLE_PASS:
+                # Steps 4-6 fused: trim + scale + overlay + concat in one FFmpeg pass
+                overlay_jobs = self.build_overlay_jobs(
+                    clip_configs,
+                    clip_paths,
+                    target_width,
+                    target_height,
+                    media_infos,
+                    first_clip_trim
+                )
+                try:
+                    merge_result = await self.ffmpeg_service.overlay_and_merge_async(overlay_jobs, output_path)
+                except Exception as e:
+                    logger.error(f"Merge failed: {str(e)}")
+                    raise Exception(f"Video merge failed: {str(e)}")
+
+                self.schedule_cleanup(downloaded_paths)
+                downloaded_paths = []
+
+                return {
+                    'success': True,
+                    'clips_processed': len(clip_configs),
+                    'target_resolution': f"{target_width}x{target_height}",
+                    'output_path': output_path,
+                    **merge_result
+                }
+
+            if Config.MERGE_STREAM_OVERLAYS:
+                # Steps 4-6 streamed: each clip's overlay encode feeds the merge through a pipe
+                overlay_jobs = self.build_overlay_jobs(
+                    clip_configs,
+                    clip_paths,
+                    target_width,
+                    target_height,
+                    media_infos,
+                    first_clip_trim
+                )
+                producers = [
+                    functools.partial(self.ffmpeg_service.stream_text_overlay, **job)
+                    for job in overlay_jobs
+                ]
+                try:
+                    merge_result = await self.ffmpeg_service.merge_videos_streaming_async(producers, output_path)
+                except Exception as e:
+                    logger.error(f"Merge failed: {str(e)}")
+                    raise Exception(f"Video merge failed: {str(e)}")
+
+                self.schedule_cleanup(downloaded_paths)
+                downloaded_paths = []
+
+                return {
+                    'success': True,
+                    'clips_processed': len(clip_configs),
+                    'target_resolution': f"{target_width}x{target_height}",
+                    'output_path': output_path,
+                    **merge_result
+                }
+
+            # Step 4: Trim + scale + overlay each clip in one pass (text wraps to correct width)
+            overlayed_paths = await self.apply_overlays_to_clips(
+                clip_configs,
+                clip_paths,
+                target_width,
+                target_height,
+                media_infos,
+                first_clip_trim
+            )
             logger.info(f"All clips scaled to target resolution: {target_width}x{target_height}")
 
-            # Step 4: Cleanup downloaded originals (no longer needed)
-            self.cleanup_files(downloaded_paths)
+            # Step 5: Cleanup downloaded originals (no longer needed) in the background
+            self.schedule_cleanup(downloaded_paths)
             downloaded_paths = []
 
-            # Step 5: Apply overlays to scaled clips (text wraps to correct width)
-            overlayed_paths = self.apply_overlays_to_clips(clip_configs, scaled_paths)
+            # Step 6: Merge all overlayed clips (no scaling needed - already same resolution)
+            merge_result = await self.merge_clips(overlayed_paths, output_path)
 
-            # Step 6: Cleanup scaled clips (no longer needed)
-            self.cleanup_files(scaled_paths)
-            scaled_paths = []
-
-            # Step 7: Merge all overlayed clips (no scaling needed - already same resolution)
-            merge_result = self.merge_clips(overlayed_paths, output_path)
-
-            # Step 8: Cleanup overlayed clips (no longer needed)
-            self.cleanup_files(overlayed_paths)
+            # Step 7: Cleanup overlayed clips (no longer needed) without delaying the response
+            self.schedule_cleanup(overlayed_paths)
             overlayed_paths = []
 
             return {
@@ -377,7 +542,6 @@ class MergeService:
         except Exception as e:
             # Cleanup on failure
             self.cleanup_files(downloaded_paths)
-            self.cleanup_files(scaled_paths)
             self.cleanup_files(overlayed_paths)
 
             logger.error(f"Merge request processing failed: {str(e)}")
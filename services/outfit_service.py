@@ -21,6 +21,7 @@ from models.schemas import (
     MAX_OUTFIT_DURATION
 )
 from services.download_service import DownloadService
+from services.ffmpeg_service import FFmpegService
 
 logger = logging.getLogger(__name__)
 
@@ -141,24 +142,21 @@ class OutfitService:
             logger.info("Running outfit FFmpeg command")
             logger.debug("FFmpeg command: %s", " ".join(cmd))
 
-            import subprocess
+            try:
+                returncode, _, stderr_bytes = await FFmpegService.run_render_async(cmd, timeout=180)
+            except asyncio.TimeoutError:
+                raise RuntimeError("Outfit processing timed out (max 3 minutes)")
 
-            process = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=180
-            )
-
-            if process.returncode != 0:
-                logger.error("Outfit FFmpeg error: %s", process.stderr)
-                raise RuntimeError(f"Outfit processing failed: {process.stderr}")
+            if returncode != 0:
+                stderr = stderr_bytes.decode("utf-8", errors="replace")
+                logger.error("Outfit FFmpeg error: %s", stderr)
+                raise RuntimeError(f"Outfit processing failed: {stderr}")
 
-            if not os.path.exists(output_path):
+            try:
+                output_size = os.stat(output_path).st_size
+            except FileNotFoundError:
                 raise RuntimeError("Outfit output file not created")
 
-            output_size = os.path.getsize(output_path)
-
             return {
                 "success": True,
                 "output_path": output_path,
@@ -172,8 +170,9 @@ class OutfitService:
                 self.download_service.cleanup_file(path)
             for path in text_files:
                 try:
-                    if os.path.exists(path):
-                        os.remove(path)
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
                 except Exception as e:
                     logger.warning("Failed to cleanup text temp file %s: %s", path, e)
 
@@ -20,6 +20,7 @@ from models.schemas import (
     MAX_POV_FADE_IN
 )
 from services.download_service import DownloadService
+from services.ffmpeg_service import FFmpegService
 
 logger = logging.getLogger(__name__)
 
@@ -173,24 +174,21 @@ class POVTemplateService:
             logger.info("Running POV FFmpeg command")
             logger.debug("FFmpeg command: %s", " ".join(cmd))
 
-            import subprocess
+            try:
+                returncode, _, stderr_bytes = await FFmpegService.run_render_async(cmd, timeout=180)
+            except asyncio.TimeoutError:
+                raise RuntimeError("POV processing timed out (max 3 minutes)")
 
-            process = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=180
-            )
-
-            if process.returncode != 0:
-                logger.error("POV FFmpeg error: %s", process.stderr)
-                raise RuntimeError(f"POV processing failed: {process.stderr}")
+            if returncode != 0:
+                stderr = stderr_bytes.decode("utf-8", errors="replace")
+                logger.error("POV FFmpeg error: %s", stderr)
+                raise RuntimeError(f"POV processing failed: {stderr}")
 
-            if not os.path.exists(output_path):
+            try:
+                output_size = os.stat(output_path).st_size
+            except FileNotFoundError:
                 raise RuntimeError("POV output file not created")
 
-            output_size = os.path.getsize(output_path)
-
             return {
                 "success": True,
                 "output_path": output_path,
@@ -203,8 +201,9 @@ class POVTemplateService:
                 self.download_service.cleanup_file(path)
             for path in text_files:
                 try:
-                    if os.path.exists(path):
-                        os.remove(path)
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
                 except Exception as e:
                     logger.warning("Failed to cleanup text temp file %s: %s", path, e)
 
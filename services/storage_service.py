@@ -1,6 +1,7 @@
 """
 Storage service for handling R2 uploads (future-ready, currently disabled)
 """
+import asyncio
 import os
 import logging
 from typing import Optional
@@ -21,6 +22,7 @@ class StorageService:
         if self.enabled:
             try:
                 import boto3
+                from boto3.s3.transfer import TransferConfig
                 from botocore.config import Config as BotoConfig
 
                 # Initialize R2 client using S3-compatible API
@@ -34,6 +36,14 @@ class StorageService:
                         region_name='auto'
                     )
                 )
+                # Multipart upload with parallel parts for large outputs
+                self.transfer_config = TransferConfig(
+                    multipart_threshold=Config.R2_MULTIPART_CHUNK_SIZE,
+                    multipart_chunksize=Config.R2_MULTIPART_CHUNK_SIZE,
+                    max_concurrency=Config.R2_UPLOAD_CONCURRENCY,
+                    io_chunksize=Config.R2_IO_CHUNK_SIZE,
+                    use_threads=True
+                )
                 self.bucket_name = Config.R2_BUCKET_NAME
                 self.custom_domain = Config.R2_CUSTOM_DOMAIN
                 logger.info("R2 storage service initialized successfully")
@@ -126,13 +136,16 @@ class StorageService:
                 object_name = filename
 
         try:
-            # Upload file with appropriate ACL
-            acl = 'public-read' if public else 'private'
-            self.client.upload_file(
+            # Upload file (boto3 blocks, so keep it off the event loop). Objects are
+            # private by default, so only public uploads need an ACL header
+            extra_args = {'ACL': 'public-read'} if public else None
+            await asyncio.to_thread(
+                self.client.upload_file,
                 file_path,
                 self.bucket_name,
                 object_name,
-                ExtraArgs={'ACL': acl}
+                ExtraArgs=extra_args,
+                Config=self.transfer_config
             )
 
             # Generate public URL using custom domain if configured
@@ -162,7 +175,8 @@ class StorageService:
             return False
 
         try:
-            self.client.delete_object(
+            await asyncio.to_thread(
+                self.client.delete_object,
                 Bucket=self.bucket_name,
                 Key=object_name
             )
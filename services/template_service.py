@@ -8,7 +8,7 @@ from typing import Optional, Dict, List
 from datetime import datetime
 from psycopg2.extras import RealDictCursor
 from services.database_service import DatabaseService
-from config import Config
+from config import Config, clear_template_cache
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +58,7 @@ class TemplateService:
 
             template = dict(cursor.fetchone())
             logger.info(f"Created template: {template['name']}")
+            clear_template_cache()
             return template
 
     def get_template(self, name: str) -> Optional[Dict]:
@@ -129,6 +130,7 @@ class TemplateService:
 
             if result:
                 logger.info(f"Updated template: {name}")
+                clear_template_cache()
                 return dict(result)
             return None
 
@@ -156,6 +158,7 @@ class TemplateService:
 
             if deleted:
                 logger.info(f"Deleted template: {name}")
+                clear_template_cache()
 
             return deleted
 